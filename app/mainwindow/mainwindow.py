@@ -1,11 +1,13 @@
+import os
 import re
 import sys
-from PySide6.QtCore import Qt, QFile, Slot
+from typing import Callable
+from PySide6.QtCore import Qt, QFile, QSize, QTimer, Slot
 from PySide6.QtGui import QBrush, QColor, QFont, QIcon
 from PySide6.QtWidgets import QApplication, QMainWindow, QGridLayout, QWidget, QColorDialog, QListWidgetItem, \
     QVBoxLayout, QListWidget, QSizePolicy, QFileDialog
 
-from app.common import ansi16_to_hex, strip_ansi_codes, ansi256_to_hex
+from app.common import ansi16_to_hex, strip_ansi_codes, ansi256_to_hex, ansi_regex, ansi_to_hex
 from app.widgets.addfontcard import AddFontCard
 from app.widgets.colordisplaywidget import ColorDisplayWidget
 from app.mainwindow.ui_mainwindow import Ui_MainWindow
@@ -21,17 +23,69 @@ from qtpop.configuration.models import SettingItem
 
 # generated by pyside6-uic
 
+# Swatches per row on the palette tab
+_PALETTE_COLUMNS = 5
+
+# Window/titlebar logo, built once per accent colour and shared across load_ui() rebuilds
+_APP_ICONS: dict[str, QIcon] = {}
+
+
+def _app_icon(qt_pop: QtPop) -> QIcon:
+    accent = qt_pop.style.get_colour('accent')
+    icon = _APP_ICONS.get(accent)
+    if icon is None:
+        icon = QIcon(qt_pop.icon.get_pixmap('action join left', accent))
+        _APP_ICONS[accent] = icon
+    return icon
+
+
 class MainWindow(QMainWindow):
+    _fonts_loaded = False  # the default fonts are app-wide; register them for the first window only
+
     def __init__(self, qt_pop: QtPop):
         super().__init__()
         self.titlebar = None
         self.icon_widget = None
         self.home = None
         self.log_widget = None
+        self._last_palette_hex = None
+        self._palette_cards: dict[str, ColorDisplayWidget] = {}
+        self._style_sig = None
+        self._in_style_update = False
+        self._icon_cache: dict[tuple[str, str, int], QIcon] = {}
+        self._pending_tabs: dict[QWidget, Callable[[], None]] = {}
+        self._qss_file_cache: dict[str, tuple[int, str]] = {}  # path -> (mtime_ns, text)
+        self._add_font_item = None
+        self._settings_pending: dict[QListWidget, list[SettingItem]] = {}
+        self._setting_widgets: list[SettingItemWidget] = []  # row widgets built so far, across all settings pages
+        self._static_settings: tuple[int, list[SettingItem]] | None = None  # (config revision, items)
+        self._grouped_user_settings_rev = -1
+        self._grouped_user_settings: dict[str, list[SettingItem]] = {}
+        self._font_cards: dict[str, tuple[QListWidgetItem, FontCard, str, int]] = {}
+        self._font_row_hints: dict[tuple[str, int], QSize] = {}
         self.qt_pop = qt_pop
+        # User settings are mutated in place by set_value, so these handles stay current
+        self._cfg_accent = qt_pop.config.get_value('accent')
+        self._cfg_support = qt_pop.config.get_value('support')
+        self._cfg_neutral = qt_pop.config.get_value('neutral')
+        self._cfg_theme = qt_pop.config.get_value('theme')
+        self._app_name = None
+        self._app_version = None
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Window)
+        self.ui.mainTW.currentChanged.connect(self._ensure_tab_built)
+        self.ui.settingsTB.currentChanged.connect(self._ensure_settings_page)
+        # Live translated preview, coalesced so typing does not re-process on every keystroke
+        self._qss_preview_timer = QTimer(self)
+        self._qss_preview_timer.setSingleShot(True)
+        self._qss_preview_timer.setInterval(120)
+        self._qss_preview_timer.timeout.connect(self._update_qss_preview)
+        self.ui.cqss.textChanged.connect(self._qss_preview_timer.start)
+        # Buttons live on static pages, so wire them once rather than on every load_ui()
+        self.ui.applybtn.clicked.connect(self._on_qss_apply_clicked)
+        self.ui.loadbtn.clicked.connect(self._on_qss_load_clicked)
+        self.ui.saveBtn.clicked.connect(self.save_settings)
         self.load_fonts()
         self.load_ui()
 
@@ -39,48 +93,73 @@ class MainWindow(QMainWindow):
         self.qt_pop.data.broadcast_message("main_window_opened", True)
 
     def load_fonts(self):
+        if MainWindow._fonts_loaded:
+            return
         self.qt_pop.font.load_font("resources/fonts/RobotoCondensed-VariableFont_wght.ttf", "h1", 18)
         self.qt_pop.font.load_font("resources/fonts/RobotoCondensed-VariableFont_wght.ttf", "h2", 14)
         self.qt_pop.font.load_font("resources/fonts/Roboto-VariableFont_wdth,wght.ttf", "p", 11)
         self.qt_pop.font.load_font("resources/fonts/RobotoCondensed-VariableFont_wght.ttf", "pc", 10)
         self.qt_pop.font.load_font("resources/fonts/Inconsolata-VariableFont_wdth,wght.ttf", "log", 11)
         self.qt_pop.font.load_font("resources/fonts/JollyLodger-Regular.ttf", "style", 12)
+        MainWindow._fonts_loaded = True
 
     def load_ui(self):
+        # Name and version are editable on the Static Settings page; re-read them
+        # once per rebuild and share them between the titlebar and home widget
+        self._app_name = self.qt_pop.config.get_value('name')
+        self._app_version = self.qt_pop.config.get_value('version')
+        self.setWindowTitle(str(self._app_name))
         self.setup_logging()
 
-        self.setup_palette()
-        self.setup_settings()
         self.setup_qss()
-        self.setup_fonts()
         self.setup_home()
-        self.setup_icons()
+
+        # Tabs that only feed their own page are (re)built the next time they are shown
+        self._pending_tabs = {
+            self.ui.settings: self.setup_settings,
+            self.ui.palette: self.setup_palette,
+            self.ui.fonts: self.setup_fonts,
+            self.ui.icons: self.setup_icons,
+        }
+        self._ensure_tab_built(self.ui.mainTW.currentIndex())
 
         if self.titlebar is not None:
             self.ui.centralwidget.layout().removeWidget(self.titlebar)
-        icon = QIcon(self.qt_pop.icon.get_pixmap('action join left', self.qt_pop.style.get_colour('accent')))  # replace with your logo path
-        self.titlebar = CustomTitleBar(self.qt_pop, self, icon, self.qt_pop.config.get_value('name'))
+            self.titlebar.deleteLater()
+        icon = _app_icon(self.qt_pop)
+        self.setWindowIcon(icon)
+        self.titlebar = CustomTitleBar(self.qt_pop, self, icon, self._app_name)
         self.ui.centralwidget.layout().insertWidget(0, self.titlebar)
 
         self.apply_style()
         self.set_application_font("pc")
 
-        self.ui.saveBtn.clicked.disconnect() if hasattr(self.ui.saveBtn, "clicked") else None
-        self.ui.saveBtn.clicked.connect(self.save_settings)
-
 
     @debug_log
     def setup_palette(self):
+        colour_map = self.qt_pop.style.colour_map()
+        palette_hex = tuple((item, colour.name()) for item, colour in colour_map.items())
+        if palette_hex == self._last_palette_hex:
+            return  # Same colours as the cards already on screen
+        self._last_palette_hex = palette_hex
+
+        if list(self._palette_cards) == list(colour_map):
+            # Same swatch names, new colours: retint the existing cards in place
+            for item, hex_val in colour_map.items():
+                self._palette_cards[item].set_color(hex_val)
+            return
+
         def load_palette():
             grid = QGridLayout()
             grid.setSpacing(5)
             grid.setContentsMargins(5, 5, 5, 5)
-            columns = 5
 
-            for i, (item, hex_val) in enumerate(self.qt_pop.style.colour_map().items()):
-                row = i // columns
-                col = i % columns
-                grid.addWidget(ColorDisplayWidget(hex_val, item), row, col)
+            self._palette_cards.clear()
+            for i, (item, hex_val) in enumerate(colour_map.items()):
+                row, col = divmod(i, _PALETTE_COLUMNS)
+                card = ColorDisplayWidget(hex_val, item)
+                self._palette_cards[item] = card
+                grid.addWidget(card, row, col)
 
             old_layout = self.ui.p_frame.layout()
             if old_layout is not None:
@@ -92,86 +171,123 @@ class MainWindow(QMainWindow):
     @debug_log
     def setup_settings(self):
         toolbox = self.ui.settingsTB
+        self._settings_pending.clear()
+        self._setting_widgets.clear()
+        toolbox.blockSignals(True)  # no page builds while pages are swapped out
         while toolbox.count() > 0:
+            page = toolbox.widget(0)
             toolbox.removeItem(0)  # clear existing pages
+            page.deleteLater()
 
-        # --- Group user settings by 'group' ---
-        grouped_settings = {}
-        for key, item in self.qt_pop.config.data.configuration.user.items():
-            grouped_settings.setdefault(item.group, []).append(item)
+        # --- User settings by 'group', static settings get their own page ---
+        pages = list(self._grouped_setting_items().items()) + [("Static Settings", self._static_setting_items())]
 
-        # --- Create a QListWidget per group ---
-        for group_name, items in grouped_settings.items():
+        # --- One QListWidget per group, filled the first time its page is opened ---
+        for group_name, items in pages:
             list_widget = QListWidget()
             list_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-
-            for item in items:
-                self.qt_pop.log.info(f"Loading setting {item.name}, value: {item.value}")
-                custom_widget = SettingItemWidget(item)
-                list_item = QListWidgetItem(list_widget)
-                hint = custom_widget.sizeHint()
-                hint.setHeight(hint.height() + 10)
-                list_item.setSizeHint(hint)
-                list_widget.addItem(list_item)
-                list_widget.setItemWidget(list_item, custom_widget)
-
+            self._settings_pending[list_widget] = items
             toolbox.addItem(list_widget, group_name)
+        toolbox.blockSignals(False)
 
-        # --- Add static settings page ---
-        static_widget = QListWidget()
-        for key, value in self.qt_pop.config.data.configuration.static.items():
-            self.qt_pop.log.info(f"Loading static setting {key}, value: {value}")
-            item = SettingItem(key, key, value, [], "Application static setting", "text", "user", "Static", "")
+        icon = self._cached_icon("app settings", self.qt_pop.style.get_colour('accent'))
+        for i in range(toolbox.count()):
+            toolbox.setItemIcon(i, icon)
+
+        self._ensure_settings_page(toolbox.currentIndex())
+
+    def _grouped_setting_items(self) -> dict[str, list[SettingItem]]:
+        """User SettingItems keyed by group, regrouped only when the config revision changes."""
+        config = self.qt_pop.config
+        if self._grouped_user_settings_rev != config.revision:
+            grouped: dict[str, list[SettingItem]] = {}
+            for item in config.data.configuration.user.values():
+                grouped.setdefault(item.group, []).append(item)
+            self._grouped_user_settings = grouped
+            self._grouped_user_settings_rev = config.revision
+        return self._grouped_user_settings
+
+    def _static_setting_items(self) -> list[SettingItem]:
+        """SettingItems for the static config, built once per config revision."""
+        config = self.qt_pop.config
+        if self._static_settings is None or self._static_settings[0] != config.revision:
+            items = [SettingItem(key, key, value, [], "Application static setting", "text", "user", "Static", "")
+                     for key, value in config.data.configuration.static.items()]
+            self._static_settings = (config.revision, items)
+        return self._static_settings[1]
+
+    @Slot(int)
+    def _ensure_settings_page(self, index: int):
+        list_widget = self.ui.settingsTB.widget(index)
+        items = self._settings_pending.pop(list_widget, None)
+        if items is None:
+            return
+        for item in items:
+            self.qt_pop.log.info(f"Loading setting {item.name}, value: {item.value}")
             custom_widget = SettingItemWidget(item)
-            list_item = QListWidgetItem(static_widget)
+            list_item = QListWidgetItem(list_widget)
             hint = custom_widget.sizeHint()
             hint.setHeight(hint.height() + 10)
             list_item.setSizeHint(hint)
-            static_widget.addItem(list_item)
-            static_widget.setItemWidget(list_item, custom_widget)
-
-        toolbox.addItem(static_widget, "Static Settings")
-
-        icon_color = self.qt_pop.style.get_colour('accent')
-        for i in range(toolbox.count()):
-            toolbox.setItemIcon(i, self.qt_pop.icon.get_pixmap("app settings", icon_color))
-
-        # --- Connect save button ---
+            list_widget.addItem(list_item)
+            list_widget.setItemWidget(list_item, custom_widget)
+            self._setting_widgets.append(custom_widget)
+
+    @Slot(int)
+    def _ensure_tab_built(self, index: int):
+        setup = self._pending_tabs.pop(self.ui.mainTW.widget(index), None)
+        if setup is not None:
+            setup()
+
+    def _cached_icon(self, name: str, colour: str, size: int = 24) -> QIcon:
+        """Return a tinted QIcon, rasterised once per (name, colour, size) and reused across rebuilds."""
+        key = (name, colour, size)
+        icon = self._icon_cache.get(key)
+        if icon is None:
+            icon = QIcon(self.qt_pop.icon.get_pixmap(name, colour, size))
+            self._icon_cache[key] = icon
+        return icon
 
     def apply_style(self):
-        accent = self.qt_pop.config.get_value('accent')
-        support = self.qt_pop.config.get_value('support')
-        neutral = self.qt_pop.config.get_value('neutral')
-        theme = self.qt_pop.config.get_value('theme')
-        self.qt_pop.style.initialise(accent.value, support.value, neutral.value, theme.value)
-
+        accent = self._cfg_accent.value
+        support = self._cfg_support.value
+        neutral = self._cfg_neutral.value
+        theme = self._cfg_theme.value
         qss = self.ui.cqss.toPlainText()
-        translated_qss = self.qt_pop.qss.process(qss)
-        self.setStyleSheet(translated_qss)
-        self.setPalette(self.qt_pop.style.get_palette())
+
+        # Style output is a pure function of these inputs; skip re-initialising when unchanged
+        sig = (accent, support, neutral, theme, qss)
+        if sig == self._style_sig or self._in_style_update:
+            return
+        self._style_sig = sig
+
+        # setStyleSheet/setPalette deliver change events synchronously; don't re-enter from them
+        self._in_style_update = True
+        try:
+            self.qt_pop.style.initialise(accent, support, neutral, theme)
+            translated_qss = self.qt_pop.qss.process(qss)
+            self.setStyleSheet(translated_qss)
+            self.setPalette(self.qt_pop.style.get_palette())
+            if self.icon_widget is not None:
+                self.icon_widget.refresh_colours()
+        finally:
+            self._in_style_update = False
+        # Let data-layer subscribers follow the applied theme. Only real changes are
+        # published, and a subscriber that calls back into apply_style hits the
+        # signature check above, so this cannot loop.
+        self.qt_pop.data.update_appearance(
+            theme, {"accent": accent, "support": support, "neutral": neutral},
+            only_if_changed=True,
+        )
 
 
     @Slot()
     @debug_log
     def save_settings(self):
-        toolbox = self.ui.settingsTB
-
-        for i in range(toolbox.count()):
-            page_widget = toolbox.widget(i)
-            group_name = toolbox.itemText(i)
-
-            # Iterate through each QListWidgetItem in the page
-            for row in range(page_widget.count()):
-                list_item = page_widget.item(row)
-                custom_widget = page_widget.itemWidget(list_item)
-                if not custom_widget:
-                    continue
-
-                # Assuming SettingItemWidget has `item` and `get_value()` methods
-                setting_item = custom_widget.item
-                new_value = setting_item.value # e.g., from QLineEdit, ComboBox, etc.
-                self.qt_pop.config.set_value(setting_item.shortname, new_value)
-                setting_item.value = new_value  # update local copy
+        # Only pages that have been opened have row widgets, and only those can hold edits
+        for custom_widget in self._setting_widgets:
+            setting_item = custom_widget.item
+            self.qt_pop.config.set_value(setting_item.shortname, setting_item.value)
 
         # Optionally persist configuration to disk
         if hasattr(self.qt_pop.config, "save"):
@@ -185,9 +301,17 @@ class MainWindow(QMainWindow):
 
     @debug_log
     def setup_logging(self):
+        status_color = None  # ANSI level colour currently applied to the status bar
+
         def on_log(timestamp: str, message: str, level: str = "INFO", color: str = ""):
             """Handle log records (for future use)."""
-            self.ui.statusbar.setStyleSheet("QStatusBar{color: " + color + "; }")
+            nonlocal status_color
+            # Consecutive records usually share a level; only re-parse the stylesheet when it changes
+            if color != status_color:
+                status_color = color
+                match = ansi_regex.match(color)
+                rule = "QStatusBar{color: " + ansi_to_hex(match) + "; }" if match else ""
+                self.ui.statusbar.setStyleSheet(rule)
             self.ui.statusbar.showMessage(message, 5000)
         # inside your setup_logging or after creating the widget instance:
         if self.log_widget is None:
@@ -195,7 +319,8 @@ class MainWindow(QMainWindow):
             self.log_widget.table.setFont(self.qt_pop.font.get_font('log'))
             # self.log_widget.setFont(self.qt_pop.font.get_font('log'))
             self.ui.log.layout().addWidget(self.log_widget)
-            self.qt_pop.log.signal.connect(self.log_widget.append_log)
+            # Queued: loggers return at once; rows arrive via the widget's flush batching
+            self.qt_pop.log.signal.connect(self.log_widget.append_log, Qt.QueuedConnection)
             self.qt_pop.log.signal.connect(on_log)
 
         self.qt_pop.log.info("Running log test messages...")
@@ -208,15 +333,11 @@ class MainWindow(QMainWindow):
     def setup_qss(self):
         """Setup QSS editor with load and apply buttons."""
         qss_path = self.qt_pop.config.get_value('qss_path')
-        file = QFile(qss_path.value)
-        default_qss = ""
-
-        if file.open(QFile.ReadOnly | QFile.Text):
-            default_qss = file.readAll().data().decode("utf-8")
-            file.close()
+        default_qss = self._read_qss_file(qss_path.value)
 
         # Set initial QSS in code editor
         self.ui.cqss.setText(default_qss)
+        self._qss_preview_timer.stop()  # filled directly below
 
         # Process and apply default QSS
         translated_qss = self.qt_pop.qss.process(default_qss)
@@ -225,33 +346,55 @@ class MainWindow(QMainWindow):
         self.ui.cqss.setFont(self.qt_pop.font.get_font('log', 10))
         self.ui.tqss.setFont(self.qt_pop.font.get_font('log', 10))
 
-        # ---- Button Connections ----
-        def on_apply_clicked():
-            """Apply QSS from cqss."""
-            raw_qss = self.ui.cqss.toPlainText()
-            translated = self.qt_pop.qss.process(raw_qss)
-            self.ui.tqss.setText(translated)
-            self.setStyleSheet(translated)
-            self.qt_pop.log.info("Applied translated QSS.")
-
-        def on_load_clicked():
-            """Load QSS file into cqss."""
-            file_path, _ = QFileDialog.getOpenFileName(
-                self,
-                "Open QSS File",
-                "",
-                "QSS Files (*.qss);;All Files (*), All Files (*)"
-            )
-            if not file_path:
-                return
-            with open(file_path, "r", encoding="utf-8") as f:
-                qss_content = f.read()
-            self.ui.cqss.setText(qss_content)
-            self.qt_pop.log.info(f"Loaded QSS file: {file_path}")
+    @Slot()
+    def _on_qss_apply_clicked(self):
+        """Apply QSS from cqss."""
+        self._qss_preview_timer.stop()
+        raw_qss = self.ui.cqss.toPlainText()
+        translated = self.qt_pop.qss.process(raw_qss)
+        self.ui.tqss.setText(translated)
+        self.setStyleSheet(translated)
+        self.qt_pop.log.info("Applied translated QSS.")
 
-        # Connect buttons
-        self.ui.applybtn.clicked.connect(on_apply_clicked)
-        self.ui.loadbtn.clicked.connect(on_load_clicked)
+    @Slot()
+    def _on_qss_load_clicked(self):
+        """Load QSS file into cqss."""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Open QSS File",
+            "",
+            "QSS Files (*.qss);;All Files (*), All Files (*)"
+        )
+        if not file_path:
+            return
+        with open(file_path, "r", encoding="utf-8") as f:
+            qss_content = f.read()
+        self.ui.cqss.setText(qss_content)
+        self.qt_pop.log.info(f"Loaded QSS file: {file_path}")
+
+    def _read_qss_file(self, path: str) -> str:
+        """Read a QSS file, reusing the last contents while its mtime is unchanged."""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        cached = self._qss_file_cache.get(path)
+        if mtime is not None and cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        text = ""
+        file = QFile(path)
+        if file.open(QFile.ReadOnly | QFile.Text):
+            text = file.readAll().data().decode("utf-8")
+            file.close()
+        if mtime is not None:
+            self._qss_file_cache[path] = (mtime, text)
+        return text
+
+    @Slot()
+    def _update_qss_preview(self):
+        translated = self.qt_pop.qss.process(self.ui.cqss.toPlainText())
+        self.ui.tqss.setText(translated)
 
     def resizeEvent(self, event, /):
         super().resizeEvent(event)
@@ -259,9 +402,10 @@ class MainWindow(QMainWindow):
 
     def setup_fonts(self):
         lw = self.ui.fontLW
-        lw.clear()
-        lw.setSpacing(6)
-        self.load_add_font(lw)
+        if self._add_font_item is None:
+            lw.clear()
+            lw.setSpacing(6)
+            self.load_add_font(lw)
         self.load_font_cards(lw)
 
     def load_add_font(self, lw):
@@ -272,26 +416,51 @@ class MainWindow(QMainWindow):
         add_item.setSizeHint(hint)
         lw.addItem(add_item)
         lw.setItemWidget(add_item, add_card)
+        self._add_font_item = add_item
 
     def load_font_cards(self, lw):
+        """Sync the font cards with the font map, touching only tags that changed."""
         font_map = self.qt_pop.font.get_font_map()
-        for tag, info in font_map.items():
-            card = FontCard(info['family'], tag, info['size'], self.set_application_font)
-            item = QListWidgetItem(lw)
+        lw.setUpdatesEnabled(False)
+        try:
+            for tag in [t for t in self._font_cards if t not in font_map]:
+                item, card, _, _ = self._font_cards.pop(tag)
+                lw.removeItemWidget(item)
+                lw.takeItem(lw.row(item))
+                card.deleteLater()
+
+            for tag, info in font_map.items():
+                family, size = info['family'], info['size']
+                entry = self._font_cards.get(tag)
+                if entry is not None:
+                    item, card, old_family, old_size = entry
+                    if (old_family, old_size) != (family, size):
+                        card.set_font(family, size)
+                        item.setSizeHint(self._font_row_hint(card, family, size))
+                        self._font_cards[tag] = (item, card, family, size)
+                    continue
+
+                card = FontCard(family, tag, size, self.set_application_font)
+                item = QListWidgetItem(lw)
+                item.setSizeHint(self._font_row_hint(card, family, size))
+                lw.addItem(item)
+                lw.setItemWidget(item, card)
+                self._font_cards[tag] = (item, card, family, size)
+        finally:
+            lw.setUpdatesEnabled(True)
+
+    def _font_row_hint(self, card: FontCard, family: str, size: int) -> QSize:
+        # Row height only varies with the preview font, so measure each (family, size) once
+        hint = self._font_row_hints.get((family, size))
+        if hint is None:
             hint = card.sizeHint()
             hint.setHeight(hint.height() + 10)
-            item.setSizeHint(hint)
-            lw.addItem(item)
-            lw.setItemWidget(item, card)
-
+            self._font_row_hints[(family, size)] = hint
+        return hint
 
     def add_font_callback(self, font_path, tag, size):
         self.qt_pop.font.load_font(font_path, tag, size)
-        lw = self.ui.fontLW
-        lw.clear()
-        lw.setSpacing(6)
-        self.load_add_font(lw)
-        self.load_font_cards(lw)
+        self.load_font_cards(self.ui.fontLW)
 
     def set_application_font(self, tag: str, size = None):
         """Sets the application-wide font."""
@@ -306,9 +475,9 @@ class MainWindow(QMainWindow):
         if self.home is None:
             self.home = MinimalAIHome(
                 qt_pop=self.qt_pop,
-                app_name= self.qt_pop.config.get_value('name'),
+                app_name=self._app_name,
                 tagline="Vivid tools. Joyful creation.",
-                version=self.qt_pop.config.get_value('version'),
+                version=self._app_version,
                 description="A cutting-edge desktop application designed for creative professionals, "
                             "offering a suite of powerful tools to bring your ideas to life with ease and precision.",
                 svg_data=None  # pass your SVG string here if you have one
@@ -1,15 +1,25 @@
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QFrame, QApplication
 )
-from PySide6.QtGui import QColor, QPainter, QBrush, QPen, QFont
+from PySide6.QtGui import QColor, QPainter, QBrush, QPen
 from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Property
+import functools
 import sys
 
 
+_BLACK = QColor(0, 0, 0)
+_WHITE = QColor(255, 255, 255)
+
+
+@functools.lru_cache(maxsize=256)
+def _contrast_for_rgb(rgb: int) -> QColor:
+    brightness = (((rgb >> 16) & 0xFF) * 299 + ((rgb >> 8) & 0xFF) * 587 + (rgb & 0xFF) * 114) / 1000
+    return _BLACK if brightness > 128 else _WHITE
+
+
 def contrast_color(color: QColor) -> QColor:
-    """Return white or black for best contrast with the given color."""
-    brightness = (color.red() * 299 + color.green() * 587 + color.blue() * 114) / 1000
-    return QColor(0, 0, 0) if brightness > 128 else QColor(255, 255, 255)
+    """Return white or black for best contrast with the given color (shared instances; do not mutate)."""
+    return _contrast_for_rgb(color.rgb())
 
 
 class ColorCard(QFrame):
@@ -19,6 +29,7 @@ class ColorCard(QFrame):
         self._color = color
         self._tag = tag
         self._hex_str = hex_str
+        self._hex_text = hex_str.upper()  # label as painted; formatted once, not per paint
         self._radius = 10
         self._hover_opacity = 0.0
         self._border_alpha = 40
@@ -64,14 +75,8 @@ class ColorCard(QFrame):
 
         # Text
         painter.setPen(contrast_color(self._color))
-        tag_font = QFont("Segoe UI", 10, QFont.DemiBold)
-        hex_font = QFont("Segoe UI", 9)
-
-        # painter.setFont(tag_font)
         painter.drawText(rect.adjusted(12, 8, -8, -8), Qt.AlignLeft | Qt.AlignTop, self._tag)
-
-        # painter.setFont(hex_font)
-        painter.drawText(rect.adjusted(8, 8, -12, -10), Qt.AlignRight | Qt.AlignBottom, self._hex_str.upper())
+        painter.drawText(rect.adjusted(8, 8, -12, -10), Qt.AlignRight | Qt.AlignBottom, self._hex_text)
 
     # --- Property for animation ---
     def get_hover_opacity(self): return self._hover_opacity
@@ -81,11 +86,14 @@ class ColorCard(QFrame):
     hover_opacity = Property(float, get_hover_opacity, set_hover_opacity)
 
     def set_color(self, color: QColor, tag=None, hex_str=None):
+        if color == self._color and (not tag or tag == self._tag) and (not hex_str or hex_str == self._hex_str):
+            return  # nothing visible changes; skip the repaint
         self._color = color
         if tag:
             self._tag = tag
         if hex_str:
             self._hex_str = hex_str
+            self._hex_text = hex_str.upper()
         self.update()
 
 
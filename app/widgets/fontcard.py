@@ -35,9 +35,9 @@ class FontCard(QFrame):
         tag_lbl.setFixedWidth(90)
 
         # --- Font Name ---
-        name_lbl = QLabel(family)
-        name_lbl.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-        name_lbl.setFixedWidth(120)
+        self.name_lbl = QLabel(family)
+        self.name_lbl.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        self.name_lbl.setFixedWidth(120)
 
         # --- Preview ---
         self.preview_lbl = QLabel("The quick brown fox jumps over the lazy dog")
@@ -75,7 +75,7 @@ class FontCard(QFrame):
 
         # --- Assemble Layout ---
         main_layout.addWidget(tag_lbl)
-        main_layout.addWidget(name_lbl)
+        main_layout.addWidget(self.name_lbl)
         main_layout.addWidget(self.preview_lbl, 1)
         main_layout.addWidget(size_container)
         main_layout.addWidget(apply_btn)
@@ -92,6 +92,16 @@ class FontCard(QFrame):
         painter.drawPath(path)
         super().paintEvent(event)
 
+    # --- Re-point an existing card at a new family/size ---
+    def set_font(self, family: str, size: int):
+        """Update the card in place when the font registered for its tag changes."""
+        self.family = family
+        self.name_lbl.setText(family)
+        if self.size_spin.value() != size:
+            self.size_spin.setValue(size)  # updates the preview via valueChanged
+        else:
+            self.preview_lbl.setFont(QFont(family, size))
+
     # --- Update preview dynamically ---
     def update_preview_size(self, value: int):
         """Update preview text font size and store it."""
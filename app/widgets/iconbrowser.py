@@ -83,7 +83,7 @@ from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QComboBox,
     QPushButton, QSpinBox, QFrame, QListWidget, QListWidgetItem
 )
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QTimer, Slot
 from PySide6.QtGui import QIcon
 import os
 
@@ -101,6 +101,12 @@ class IconBrowserWidget(QWidget):
         self.current_icons = self.all_icons
         self.current_color = self.qt_pop.style.get_colour("accent")
         self.icon_size = 60  # ✅ default icon size
+        # Icons for a single (colour, size) tint; cleared when the tint changes so it
+        # never holds more than one QIcon per icon name
+        self._icon_cache: dict[str, QIcon] = {}
+        self._icon_cache_tint: tuple[str, int] | None = None
+        self._icons_populated = False
+        self._shown_state = None  # (colour, size, icon list) currently displayed
 
         # ---------- Layout ----------
         main_layout = QVBoxLayout(self)
@@ -115,12 +121,19 @@ class IconBrowserWidget(QWidget):
         self.search_box = QLineEdit()
         self.search_box.setPlaceholderText("Search icons...")
         self.search_box.textChanged.connect(self._on_search)
+
+        # Only filter once typing pauses; each keystroke restarts the timer
+        self._search_debounce = QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(75)
+        self._search_debounce.timeout.connect(self._apply_search)
+        self._applied_query = ""
         top_bar.addWidget(self.search_box, stretch=2)
 
         # Color selector
         self.color_combo = QComboBox()
-        for name, hex_code in self.qt_pop.style.colour_map().items():
-            self.color_combo.addItem(name, hex_code)
+        self._colour_map_sig = None  # (name, hex) pairs the combo was last filled from
+        self._fill_colour_combo()
         self.color_combo.currentTextChanged.connect(self._on_color_change)
         top_bar.addWidget(self.color_combo)
 
@@ -160,7 +173,7 @@ class IconBrowserWidget(QWidget):
         self.list_widget.setWrapping(True)
         self.list_widget.setSpacing(20)  # ✅ more spacing
         self.list_widget.setMovement(QListWidget.Static)
-        self.list_widget.setUniformItemSizes(False)  # ✅ allow variable height
+        self.list_widget.setUniformItemSizes(True)  # every item shares the same size hint
         self.list_widget.setWordWrap(True)  # ✅ allow text wrapping
         self.list_widget.setVerticalScrollMode(QListWidget.ScrollPerPixel)
         self.list_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
@@ -169,41 +182,128 @@ class IconBrowserWidget(QWidget):
         main_layout.addWidget(self.list_widget)
         self.setLayout(main_layout)
 
-        # populate icons initially
-        self._populate_icons()
+        # icons are populated on first show, see showEvent()
+
+    def showEvent(self, event):
+        """Rasterise the icon grid after the first paint instead of at construction."""
+        super().showEvent(event)
+        if not self._icons_populated:
+            self._icons_populated = True
+            QTimer.singleShot(0, self._populate_icons)
 
     # -------------------------------
     # Populate Icons
     # -------------------------------
     def _populate_icons(self):
-        self.list_widget.clear()
-        if not self.current_icons:
-            item = QListWidgetItem("No icons found")
-            self.list_widget.addItem(item)
-            return
-
-        self.list_widget.setIconSize(QSize(self.icon_size, self.icon_size))  # ✅ ensure correct icon size
-
-        for icon_name in self.current_icons:
+        self._icons_populated = True
+        same_icons = False
+        if self._shown_state is not None:
+            colour, size, icons = self._shown_state
+            if colour == self.current_color and size == self.icon_size and icons is self.current_icons:
+                return  # Same tint, size and icons as what is already displayed
+            same_icons = icons is self.current_icons and self.list_widget.count() == len(icons)
+        self._shown_state = (self.current_color, self.icon_size, self.current_icons)
+
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            self.list_widget.setIconSize(QSize(self.icon_size, self.icon_size))  # ✅ ensure correct icon size
+            size_hint = QSize(self.icon_size + 60, self.icon_size + 60)
+
+            if same_icons and self.current_icons:
+                # Only tint/size changed: retint the existing items in place
+                for row, icon_name in enumerate(self.current_icons):
+                    item = self.list_widget.item(row)
+                    item.setIcon(self._get_icon(icon_name))
+                    item.setSizeHint(size_hint)
+                return
+
+            self.list_widget.clear()
+            if not self.current_icons:
+                item = QListWidgetItem("No icons found")
+                self.list_widget.addItem(item)
+                return
+
+            for icon_name in self.current_icons:
+                icon = self._get_icon(icon_name)
+                item = QListWidgetItem(icon, icon_name)
+                item.setSizeHint(size_hint)
+                item.setTextAlignment(Qt.AlignHCenter | Qt.AlignTop)
+                self.list_widget.addItem(item)
+        finally:
+            # Lay out and repaint once for the whole batch
+            self.list_widget.setUpdatesEnabled(True)
+
+    def _get_icon(self, icon_name: str) -> QIcon:
+        """Return a shared QIcon for the current tint/size, rasterising it only once."""
+        tint = (self.current_color, self.icon_size)
+        if tint != self._icon_cache_tint:
+            self._icon_cache.clear()
+            self._icon_cache_tint = tint
+        icon = self._icon_cache.get(icon_name)
+        if icon is None:
             pixmap = IconManager.get_pixmap(icon_name, self.current_color, size=self.icon_size)
             icon = QIcon(pixmap)
-            item = QListWidgetItem(icon, icon_name)
-            item.setSizeHint(QSize(self.icon_size + 60, self.icon_size + 60))
-            item.setTextAlignment(Qt.AlignHCenter | Qt.AlignTop)
-            self.list_widget.addItem(item)
+            self._icon_cache[icon_name] = icon
+        return icon
 
     # -------------------------------
     # Handlers
     # -------------------------------
+    @Slot(str)
     def _on_search(self, text: str):
-        self.current_icons = IconManager.search_icons(text, self.all_icons)
-        # self._populate_icons()
+        self._search_debounce.start()
+
+    @Slot()
+    def _apply_search(self):
+        query = self.search_box.text()
+        if query == self._applied_query:
+            return
+        self._applied_query = query
+        self.current_icons = IconManager.search_icons(query, self.all_icons)
+        self._populate_icons()
+
+    def _fill_colour_combo(self) -> bool:
+        """Sync the colour combo with the style's colour map; False if nothing changed."""
+        sig = tuple((name, colour.name()) for name, colour in self.qt_pop.style.colour_map().items())
+        if sig == self._colour_map_sig:
+            return False
+        self._colour_map_sig = sig
+
+        current = self.color_combo.currentText()
+        self.color_combo.blockSignals(True)
+        try:
+            if [self.color_combo.itemText(i) for i in range(self.color_combo.count())] == [n for n, _ in sig]:
+                # Same names, new shades: only the item data moves
+                for i, (_, hex_code) in enumerate(sig):
+                    self.color_combo.setItemData(i, hex_code)
+            else:
+                self.color_combo.clear()
+                for name, hex_code in sig:
+                    self.color_combo.addItem(name, hex_code)
+                index = self.color_combo.findText(current)
+                if index >= 0:
+                    self.color_combo.setCurrentIndex(index)
+        finally:
+            self.color_combo.blockSignals(False)
+        return True
+
+    def refresh_colours(self):
+        """Pick up a re-initialised palette, re-tinting with the selected colour name."""
+        if not self._fill_colour_combo():
+            return
+        hex_code = self.color_combo.currentData()
+        if hex_code:
+            self.current_color = hex_code
+        if self._icons_populated:
+            self._populate_icons()
 
+    @Slot(str)
     def _on_color_change(self, key: str):
         color_map = self.qt_pop.style.colour_map()
         self.current_color = color_map[key].name()
         self._populate_icons()
 
+    @Slot(int)
     def _on_size_change(self, val: int):
         """Update icon and item size dynamically"""
         self.icon_size = val
@@ -213,8 +313,11 @@ class IconBrowserWidget(QWidget):
             item.setSizeHint(QSize(val + 40, val + 50))  # ✅ adjust the visual space
         self._populate_icons()  # ✅ reload icons with new pixmaps
 
+    @Slot()
     def _on_refresh(self):
         IconManager.clear_cache()
+        self._icon_cache.clear()
+        self._shown_state = None
         self.all_icons = IconManager.list_icons()
         self._populate_icons()
 
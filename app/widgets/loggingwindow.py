@@ -18,7 +18,7 @@ import re
 from datetime import datetime
 from typing import Iterable, Tuple
 
-from PySide6.QtCore import Qt, QSortFilterProxyModel, QModelIndex, QEvent, QPoint
+from PySide6.QtCore import Qt, QSortFilterProxyModel, QModelIndex, QEvent, QPoint, QTimer, Slot
 from PySide6.QtGui import QStandardItemModel, QStandardItem, QFont, QColor, QCursor, QGuiApplication
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QPushButton, QComboBox, QLineEdit, QTableView,
@@ -120,6 +120,14 @@ class QLogWidget(QWidget):
         self.buffer = deque(maxlen=max_rows)  # store tuples (ts, level, msg, raw, color)
         self.paused = False
         self.autoscroll = True
+        self._clipboard = QGuiApplication.clipboard()
+
+        # Entries waiting to be pushed to the model in one batch
+        self._pending = deque(maxlen=max_rows)
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.timeout.connect(self._flush_pending)
 
         self._setup_fonts_and_palette()
         self._build_ui()
@@ -240,7 +248,7 @@ class QLogWidget(QWidget):
         layout.addLayout(bottom)
 
     def _connect_signals(self):
-        self.level_combo.currentTextChanged.connect(lambda t: self.proxy.set_min_level(t))
+        self.level_combo.currentTextChanged.connect(self._on_level_changed)
         self.search_edit.textChanged.connect(self.proxy.set_search)
         self.pause_btn.toggled.connect(self._on_pause_toggled)
         self.autoscroll_chk.toggled.connect(self._on_autoscroll_toggled)
@@ -271,6 +279,7 @@ class QLogWidget(QWidget):
         except Exception as e:
             raise RuntimeError(f"Failed to connect logger signal: {e}")
 
+    @Slot(str, str, str, str)
     def append_log(self, timestamp: str, message: str, level: str = "INFO", color: str = ""):
         """
         Append a log entry. Trims leading whitespace from message as requested.
@@ -291,8 +300,12 @@ class QLogWidget(QWidget):
         self.buffer.append((ts, lvl, trimmed, raw_msg, color))
 
         if not self.paused:
-            self._push_to_model(ts, lvl, trimmed, raw_msg, color)
+            self._pending.append((ts, lvl, trimmed, raw_msg, color))
+            # while the log tab is hidden, keep queuing; showEvent flushes
+            if self.isVisible() and not self._flush_timer.isActive():
+                self._flush_timer.start()
 
+    @Slot(str, str, str, str)
     def _on_external_log(self, timestamp, message, level, color):
         # convert to strings robustly
         try:
@@ -312,13 +325,7 @@ class QLogWidget(QWidget):
     # -----------------------
     # Model / view handling
     # -----------------------
-    def _push_to_model(self, ts: str, lvl: str, msg: str, raw: str, color: str):
-        # prune if model is already at capacity
-        if self.model.rowCount() >= self.max_rows:
-            remove_count = max(1, self.model.rowCount() - self.max_rows + 1)
-            for _ in range(remove_count):
-                self.model.removeRow(0)
-
+    def _make_row(self, ts: str, lvl: str, msg: str, raw: str, color: str):
         # prepare items
         t_item = QStandardItem(ts if ts is not None else "")
         l_item = QStandardItem(lvl)
@@ -338,46 +345,58 @@ class QLogWidget(QWidget):
         t_item.setForeground(qcolor)
         l_item.setForeground(qcolor)
         m_item.setForeground(qcolor)
+        return [t_item, l_item, m_item]
+
+    @Slot()
+    def _flush_pending(self):
+        """Push every queued entry to the model with a single prune, count update and scroll."""
+        if not self._pending:
+            return
+        entries = list(self._pending)
+        self._pending.clear()
 
-        # insert row
-        row_pos = self.model.rowCount()
-        self.model.insertRow(row_pos, [t_item, l_item, m_item])
+        # prune so the model stays within capacity after the batch
+        overflow = self.model.rowCount() + len(entries) - self.max_rows
+        if overflow > 0:
+            self.model.removeRows(0, min(overflow, self.model.rowCount()))
+
+        for entry in entries:
+            self.model.appendRow(self._make_row(*entry))
         self.count_label.setText(f"{self.model.rowCount()} entries")
 
         if self.autoscroll:
             self.table.scrollToBottom()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pending and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
     # -----------------------
     # Controls
     # -----------------------
+    @Slot(str)
+    def _on_level_changed(self, level_name: str):
+        self.proxy.set_min_level(level_name)
+
+    @Slot(bool)
     def _on_pause_toggled(self, state: bool):
         self.paused = state
         if not self.paused:
             # rebuild the model from buffer tail to ensure consistency and ordering
             tail = list(self.buffer)[-self.max_rows:]
+            self._pending.clear()
             self.model.removeRows(0, self.model.rowCount())
             for ts, lvl, trimmed, raw, color in tail:
-                # use _push_to_model but avoid re-pruning since buffer already respects max_rows
-                t_item = QStandardItem(ts)
-                l_item = QStandardItem(lvl)
-                m_item = QStandardItem(trimmed)
-                for it in (t_item, l_item, m_item):
-                    it.setData(ts, ROLE_TIMESTAMP)
-                    it.setData(lvl, ROLE_LEVEL)
-                    it.setData(trimmed, ROLE_MESSAGE)
-                    it.setData(raw, ROLE_RAW)
-                    it.setData(color, ROLE_COLOR)
-                    it.setFont(self.compact_font)
-                qcolor = _LEVEL_COLORS.get(lvl.upper(), QColor(150, 150, 150))
-                t_item.setForeground(qcolor)
-                l_item.setForeground(qcolor)
-                m_item.setForeground(qcolor)
-                self.model.appendRow([t_item, l_item, m_item])
+                # buffer already respects max_rows, so no pruning is needed here
+                self.model.appendRow(self._make_row(ts, lvl, trimmed, raw, color))
             self.count_label.setText(f"{self.model.rowCount()} entries")
 
+    @Slot(bool)
     def _on_autoscroll_toggled(self, s: bool):
         self.autoscroll = s
 
+    @Slot(bool)
     def _on_wrap_toggled(self, s: bool):
         self.table.setWordWrap(s)
         if s:
@@ -386,6 +405,7 @@ class QLogWidget(QWidget):
         else:
             self.table.verticalHeader().setDefaultSectionSize(15)
 
+    @Slot(bool)
     def _on_timestamp_toggled(self, s: bool):
         self.table.setColumnHidden(0, not s)
         if s:
@@ -393,14 +413,18 @@ class QLogWidget(QWidget):
         else:
             self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
 
+    @Slot(bool)
     def _on_debug_toggled(self, s: bool):
         self.qt_pop.log.enable_debug(s)
 
+    @Slot()
     def clear(self):
+        self._pending.clear()
         self.model.removeRows(0, self.model.rowCount())
         self.buffer.clear()
         self.count_label.setText("0 entries")
 
+    @Slot()
     def copy_selected(self):
         sel = self.table.selectionModel().selectedRows()
         if not sel:
@@ -413,10 +437,10 @@ class QLogWidget(QWidget):
             lvl = self.model.data(self.model.index(src_index.row(), 1), ROLE_LEVEL) or ""
             msg = self.model.data(self.model.index(src_index.row(), 2), ROLE_MESSAGE) or ""
             lines.append(f"{ts} | {lvl} | {msg}")
-        clipboard = QGuiApplication.clipboard()
-        clipboard.setText("\n".join(lines))
+        self._clipboard.setText("\n".join(lines))
         QMessageBox.information(self, "Copy Selected", f"Copied {len(lines)} rows to clipboard.")
 
+    @Slot()
     def export_csv(self):
         path, _ = QFileDialog.getSaveFileName(self, "Export Logs to CSV", "logs.csv", "CSV Files (*.csv);;All Files (*)")
         if not path:
@@ -434,6 +458,7 @@ class QLogWidget(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Export CSV", f"Failed to export logs: {e}")
 
+    @Slot(QModelIndex)
     def _on_row_doubleclicked(self, proxy_index: QModelIndex):
         src = self.proxy.mapToSource(proxy_index)
         ts = self.model.data(self.model.index(src.row(), 0), ROLE_TIMESTAMP) or ""
@@ -442,11 +467,13 @@ class QLogWidget(QWidget):
         dlg = MessageViewerDialog(f"{ts} | {lvl}", raw, self)
         dlg.exec()
 
+    @Slot(int)
     def _on_max_rows_changed(self, val: int):
         self.max_rows = val
         # change buffer capacity while preserving recent items
         new_buf = deque(self.buffer, maxlen=val)
         self.buffer = new_buf
+        self._pending = deque(self._pending, maxlen=val)
         # prune model if needed
         while self.model.rowCount() > val:
             self.model.removeRow(0)
@@ -52,14 +52,14 @@ class SettingItemWidget(QWidget):
 
         if self.item.type == "text":
             self.control = QLineEdit(str(self.item.value))
-            self.control.textChanged.connect(self._on_text_changed)
+            self.control.editingFinished.connect(self._on_editing_finished)
             self.control_layout.addWidget(self.control)
 
         elif self.item.type == "filebrowse":
             self.control = QLineEdit(str(self.item.value))
             browse_btn = QPushButton("Browse…")
             browse_btn.clicked.connect(self._browse_file)
-            self.control.textChanged.connect(self._on_text_changed)
+            self.control.editingFinished.connect(self._on_editing_finished)
             self.control_layout.addWidget(self.control)
             self.control_layout.addWidget(browse_btn)
 
@@ -67,7 +67,7 @@ class SettingItemWidget(QWidget):
             self.control = QLineEdit(str(self.item.value))
             browse_btn = QPushButton("Browse…")
             browse_btn.clicked.connect(self._browse_folder)
-            self.control.textChanged.connect(self._on_text_changed)
+            self.control.editingFinished.connect(self._on_editing_finished)
             self.control_layout.addWidget(self.control)
             self.control_layout.addWidget(browse_btn)
 
@@ -101,8 +101,9 @@ class SettingItemWidget(QWidget):
         self.setMinimumHeight(52)
 
     # --- Handlers ---
-    def _on_text_changed(self, text):
-        self.item.value = text
+    def _on_editing_finished(self):
+        # Commit once per edit (Enter or focus out) rather than on every keystroke
+        self.item.value = self.control.text()
 
     def _on_dropdown_changed(self, text):
         self.item.value = text
@@ -122,19 +123,14 @@ class SettingItemWidget(QWidget):
     def _pick_color(self):
         initial = QColor(self.item.value) if self.item.value else QColor("white")
         color = QColorDialog.getColor(initial, self, "Select Color")
-        if color.isValid():
-            self.item.value = color.name()
-            self._update_color_button(color)
+        if not color.isValid() or color == initial:
+            return  # Cancelled, or re-picked the current colour: nothing to rebuild
+        self.item.value = color.name()
+        self._update_color_button(color)
 
     def _update_color_button(self, color: QColor):
         # Use palette color fill instead of stylesheet
         pal = self.control.palette()
         pal.setColor(self.control.backgroundRole(), color)
-        self.control_layout.removeWidget(self.colour_display)
-        self.control_layout.removeWidget(self.control)
-
-        self.colour_display.deleteLater()
-        self.colour_display = ColorDisplayWidget(color, self.item.shortname)
-
-        self.control_layout.addWidget(self.colour_display)
-        self.control_layout.addWidget(self.control)
\ No newline at end of file
+        # Retint the existing swatch rather than rebuilding it
+        self.colour_display.set_color(color)
\ No newline at end of file
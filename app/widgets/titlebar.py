@@ -6,6 +6,13 @@ from PySide6.QtWidgets import (
 
 from qtpop import QtPop
 
+# (attribute, icon name, slot) for the window control buttons, left to right
+_WINDOW_BUTTONS = (
+    ("min_button", "action minimize", "_minimize"),
+    ("max_button", "navigation fullscreen", "_maximize_restore"),
+    ("close_button", "navigation close", "_close"),
+)
+
 
 class CustomTitleBar(QWidget):
     """Professional, painter-based custom titlebar for Windows."""
@@ -59,35 +66,14 @@ class CustomTitleBar(QWidget):
         ))
 
         # --- Window control buttons ---
-        self.min_button = QToolButton()
-        self.min_button.setAutoRaise(True)
-        self.min_button.setContentsMargins(5, 0, 0, 0)
-        self.min_button.setIcon(self.qt_pop.icon.get_pixmap(
-            'action minimize',
-            self.qt_pop.style.get_colour('fg1'),
-            self.icon_size
-        ))
-        self.min_button.clicked.connect(self._minimize)
-
-        self.max_button = QToolButton()
-        self.max_button.setAutoRaise(True)
-        self.max_button.setContentsMargins(5, 0, 0, 0)
-        self.max_button.setIcon(self.qt_pop.icon.get_pixmap(
-            'navigation fullscreen',
-            self.qt_pop.style.get_colour('fg1'),
-            self.icon_size
-        ))
-        self.max_button.clicked.connect(self._maximize_restore)
-
-        self.close_button = QToolButton()
-        self.close_button.setAutoRaise(True)
-        self.close_button.setContentsMargins(5, 0, 0, 0)
-        self.close_button.setIcon(self.qt_pop.icon.get_pixmap(
-            'navigation close',
-            self.qt_pop.style.get_colour('fg1'),
-            self.icon_size
-        ))
-        self.close_button.clicked.connect(self._close)
+        control_colour = self.qt_pop.style.get_colour('fg1')
+        for attr, icon_name, slot in _WINDOW_BUTTONS:
+            button = QToolButton()
+            button.setAutoRaise(True)
+            button.setContentsMargins(5, 0, 0, 0)
+            button.setIcon(self.qt_pop.icon.get_pixmap(icon_name, control_colour, self.icon_size))
+            button.clicked.connect(getattr(self, slot))
+            setattr(self, attr, button)
 
         # --- Layout ---
         layout = QHBoxLayout(self)
@@ -108,11 +94,34 @@ class CustomTitleBar(QWidget):
     # Resize grips
     # -------------------
     def _create_grips(self):
-        self.grips = [QSizeGrip(self) for _ in range(4)]
-        for g in self.grips:
-            g.setVisible(False)
+        # Built by _ensure_grips() on first show, and only for a resizable parent;
+        # until then nothing extra takes part in layout/paint.
+        self.grips = []
+
+    def _ensure_grips(self):
+        """Create the four corner grips the first time they are needed."""
+        if not self.grips:
+            self.grips = [QSizeGrip(self) for _ in range(4)]
+            for g in self.grips:
+                g.setVisible(False)
+            self._layout_grips()
+        return self.grips
+
+    def _parent_resizable(self) -> bool:
+        pw = self.parent_window
+        return bool(pw) and pw.minimumSize() != pw.maximumSize()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._parent_resizable():
+            self._ensure_grips()
 
     def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.grips:
+            self._layout_grips()
+
+    def _layout_grips(self):
         if not self.parent_window:
             return
         grip_size = 12
@@ -172,17 +181,17 @@ class CustomTitleBar(QWidget):
         if self.parent_window.isMaximized():
             self.parent_window.showNormal()
             self.max_button.setIcon(self.qt_pop.icon.get_pixmap(
-            'navigation fullscreen',
-            self.qt_pop.style.get_colour('fg2'),
-            self.icon_size
-        ))
+                'navigation fullscreen',
+                self.qt_pop.style.get_colour('fg2'),
+                self.icon_size
+            ))
         else:
             self.parent_window.showMaximized()
             self.max_button.setIcon(self.qt_pop.icon.get_pixmap(
-            'navigation fullscreen exit',
-            self.qt_pop.style.get_colour('fg2'),
-            self.icon_size
-        ))
+                'navigation fullscreen exit',
+                self.qt_pop.style.get_colour('fg2'),
+                self.icon_size
+            ))
 
     def _close(self):
         if self.parent_window:
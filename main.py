@@ -1,5 +1,8 @@
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 import nova.app
@@ -8,12 +11,32 @@ from nova.core.config import ConfigManager
 from nova.core.style import StyleManager
 from nova.core.icons import IconManager
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+# Configure logging: the root logger only enqueues records; a listener thread
+# owns the stream handler so console I/O never blocks the GUI thread.
+# CRITICAL records bypass the queue and are written synchronously, since the
+# process may abort (e.g. QtFatalMsg) before atexit ever drains the listener.
+_LOG_FORMAT = logging.Formatter(
+    "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     datefmt="%H:%M:%S",
 )
+_log_queue: queue.Queue = queue.Queue(-1)
+_stream = logging.StreamHandler()
+_stream.setFormatter(_LOG_FORMAT)
+_stream.addFilter(lambda record: record.levelno < logging.CRITICAL)
+_critical = logging.StreamHandler()
+_critical.setLevel(logging.CRITICAL)
+_critical.setFormatter(_LOG_FORMAT)
+# prepare() bakes the formatted text into record.msg; keep it prefix-free so
+# the listener's formatter is the only one adding time/level/name.
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+_root = logging.getLogger()
+_root.setLevel(logging.DEBUG)
+_root.addHandler(_queue_handler)
+_root.addHandler(_critical)
+_log_listener = QueueListener(_log_queue, _stream, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # drains queued records before exit
 
 if __name__ == "__main__":
     root_dir = Path(__file__).parent
@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import logging
 import sys
+import threading
+import time
 from pathlib import Path
 
+from PySide6.QtCore import QObject, Qt, QtMsgType, Slot, qInstallMessageHandler
+from PySide6.QtGui import QFont, QFontDatabase
 from PySide6.QtWidgets import QApplication
 
 from nova.core.plugin_manager import PluginManager
-from nova.pages.about_page import AboutPage
+from nova.core.style import StyleManager, read_qss
 from nova.pages.home_page import HomePage
 from nova.pages.log_page import LogPage
 from nova.pages.plugins_page import PluginsPage
@@ -16,132 +20,209 @@ from nova.ui.main_window import MainWindow
 
 _log = logging.getLogger(__name__)
 
+_PROJECT_ROOT = Path(__file__).parent.parent
+_QSS_PATH = _PROJECT_ROOT / "resources" / "qss" / "nova.qss"
+
+# Qt message type -> logger method; anything else (QtDebugMsg) logs at debug
+_QT_MSG_DISPATCH = {
+    QtMsgType.QtInfoMsg:     _log.info,
+    QtMsgType.QtWarningMsg:  _log.warning,
+    QtMsgType.QtCriticalMsg: _log.error,
+    QtMsgType.QtFatalMsg:    _log.critical,
+}
+
+# Qt can repeat the same warning hundreds of times during a QSS re-apply:
+# identical (type, text) pairs are logged at most once per window, and at most
+# _QT_MSG_RATE messages go through per second overall. Fatal messages always pass.
+_QT_DEDUPE_WINDOW_S = 5.0
+_QT_MSG_RATE = 500
+_QT_SEEN_LIMIT = 1024
+_qt_last_seen: dict = {}      # (mode, message) -> monotonic time last logged
+_qt_tokens = float(_QT_MSG_RATE)
+_qt_tokens_at = 0.0
+# Qt calls the handler on whichever thread logged; guards the state above
+_qt_msg_lock = threading.Lock()
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _resolve_plugins_dir(config) -> Path:
-    try:
-        raw = config.get_value("system.plugins_path", "./plugins")
-    except Exception:
-        raw = "./plugins"
+def _project_path(raw: str) -> Path:
+    """Absolute paths pass through; relative ones are taken from the project root."""
     p = Path(raw)
-    if not p.is_absolute():
-        p = Path(__file__).parent.parent / p
-    return p
+    return p if p.is_absolute() else _PROJECT_ROOT / p
+
+
+def _resolve_plugins_dir(config) -> Path:
+    # get_value returns the (non-None) default when the key is missing
+    return _project_path(config.get_value("system.plugins_path", "./plugins"))
 
 
 def _apply_font_from_config(config, app) -> None:
+    path = config.get_value("appearance.font", "")
+    if not path:
+        return
+    p = Path(path)
+    if not (p.exists() and p.suffix.lower() in (".ttf", ".otf")):
+        return
     try:
-        path = config.get_value("appearance.font", "")
-        if path:
-            p = Path(path)
-            if p.exists() and p.suffix.lower() in (".ttf", ".otf"):
-                from PySide6.QtGui import QFont, QFontDatabase
-                from nova.core.style import StyleManager
-                fid = QFontDatabase.addApplicationFont(str(p))
-                families = QFontDatabase.applicationFontFamilies(fid)
-                if families:
-                    StyleManager.set_font_family(families[0])
-                    app.setFont(QFont(families[0]))
+        fid = QFontDatabase.addApplicationFont(str(p))
+        families = QFontDatabase.applicationFontFamilies(fid)
+        if families:
+            StyleManager.set_font_family(families[0])
+            app.setFont(QFont(families[0]))
     except Exception as exc:
         _log.warning("Font load failed at startup: %s", exc)
 
 
-def _wire_pm_signals(pm, home, window, plugins_pg, settings) -> None:
-    def _update_home(*_):
-        home.update_stats(pm.loaded_count(), pm.active_count())
-
-    pm.plugin_loaded.connect(_update_home)
-    pm.plugin_started.connect(_update_home)
-    pm.plugin_stopped.connect(_update_home)
-    pm.plugin_crashed.connect(_update_home)
-    pm.plugin_deleted.connect(_update_home)
-    pm.plugin_imported.connect(_update_home)
-    _update_home()
-
-    def _on_navigate(pid: str):
-        if f"plugin_{pid}" in window._pages:
-            window.navigate(f"plugin_{pid}")
-
-    plugins_pg.navigate_to_plugin.connect(_on_navigate)
+class _PluginManagerWiring(QObject):
+    """
+    Connects one PluginManager (and the Plugins page) to the shell.
+
+    Handlers are bound @Slot methods, and every connection handle is kept so a
+    hot reload can drop them all with disconnect_all() before rewiring.
+    """
+
+    def __init__(self, pm, home, window, plugins_pg, parent: QObject | None = None):
+        super().__init__(parent)
+        self.pm = pm
+        self._home = home
+        self._window = window
+        self._plugins_pg = plugins_pg
+        self._connections: list = []
+
+        # PluginManager and PluginsPage live on the GUI thread, so every
+        # connection is made direct; slot signatures match the emitters.
+        direct = Qt.ConnectionType.DirectConnection
+        for signal, slot in (
+            (pm.plugin_loaded,           self._update_home),
+            (pm.plugin_started,          self._update_home),
+            (pm.plugin_stopped,          self._update_home),
+            (pm.plugin_crashed,          self._update_home),
+            (pm.plugin_deleted,          self._update_home),
+            (pm.plugin_imported,         self._update_home),
+            (plugins_pg.navigate_to_plugin, self._on_navigate),
+            (pm.plugin_favorite_changed, self._on_favorite_changed),
+            (pm.plugin_imported,         self._on_plugin_imported),
+            (pm.plugin_deleted,          self._on_plugin_deleted),
+        ):
+            self._connections.append(signal.connect(slot, direct))
+        self._update_home()
+
+    def disconnect_all(self) -> None:
+        for connection in self._connections:
+            QObject.disconnect(connection)
+        self._connections.clear()
+
+    @Slot()
+    def _update_home(self, *_: object):
+        self._home.update_stats(self.pm.loaded_count(), self.pm.active_count())
+
+    @Slot(str)
+    def _on_navigate(self, pid: str):
+        page_id = f"plugin_{pid}"
+        if self._window.has_plugin_page(page_id):
+            self._window.navigate(page_id)
 
-    def _on_favorite_changed(pid: str, is_fav: bool):
+    @Slot(str, bool)
+    def _on_favorite_changed(self, pid: str, is_fav: bool):
         page_id = f"plugin_{pid}"
-        if page_id not in window._pages:
+        if not self._window.has_plugin_page(page_id):
             return
-        record = pm._records.get(pid)
-        if record is None:
+        manifest = self.pm.get_manifest(pid)
+        if manifest is None:
             return
         if is_fav:
-            window.show_plugin_in_sidebar(page_id, record.manifest.name,
-                                           record.manifest.icon or "extension")
+            self._window.show_plugin_in_sidebar(page_id, manifest.name,
+                                                manifest.icon or "extension")
         else:
-            window.hide_plugin_from_sidebar(page_id)
-
-    pm.plugin_favorite_changed.connect(_on_favorite_changed)
+            self._window.hide_plugin_from_sidebar(page_id)
 
-    def _on_plugin_imported(pid: str):
+    @Slot(str)
+    def _on_plugin_imported(self, pid: str):
+        pm = self.pm
         if pm.load(pid):
             widget = pm.create_widget(pid)
             if widget is not None:
-                record = pm._records.get(pid)
-                title = record.manifest.name if record else pid
-                icon = record.manifest.icon if record else "extension"
-                window.add_plugin_page(f"plugin_{pid}", title, icon, widget,
-                                       pm.is_favorite(pid))
-        plugins_pg.refresh()
-        _update_home()
-
-    pm.plugin_imported.connect(_on_plugin_imported)
-
-    def _on_plugin_deleted(pid: str):
-        window.remove_plugin_page(f"plugin_{pid}")
-        _update_home()
-
-    pm.plugin_deleted.connect(_on_plugin_deleted)
-
-
-def _do_plugin_hot_reload(ctx, new_path_str: str, old_pm,
-                          window, plugins_pg, settings, home) -> PluginManager:
-    old_pm.stop_all()
-    for pid in list(window._pages.keys()):
-        if pid.startswith("plugin_"):
-            window.remove_plugin_page(pid)
-
-    new_path = Path(new_path_str)
-    if not new_path.is_absolute():
-        new_path = Path(__file__).parent.parent / new_path
-
-    new_pm = PluginManager(ctx, new_path)
+                manifest = pm.get_manifest(pid)
+                title = manifest.name if manifest else pid
+                icon = manifest.icon if manifest else "extension"
+                self._window.add_plugin_page(f"plugin_{pid}", title, icon, widget,
+                                             pm.is_favorite(pid))
+        self._plugins_pg.refresh()
+        self._update_home()
+
+    @Slot(str)
+    def _on_plugin_deleted(self, pid: str):
+        self._window.remove_plugin_page(f"plugin_{pid}")
+        self._update_home()
+
+
+def _do_plugin_hot_reload(ctx, new_path_str: str, old_wiring: _PluginManagerWiring,
+                          window, plugins_pg, settings, home) -> _PluginManagerWiring:
+    old_wiring.disconnect_all()
+    old_wiring.deleteLater()
+    old_wiring.pm.stop_all()
+    for page_id in window.plugin_page_ids():
+        window.remove_plugin_page(page_id)
+
+    new_pm = PluginManager(ctx, _project_path(new_path_str))
     window._pm = new_pm
     plugins_pg.update_plugin_manager(new_pm)
     settings.update_plugin_manager(new_pm)
-    _wire_pm_signals(new_pm, home, window, plugins_pg, settings)
+    wiring = _PluginManagerWiring(new_pm, home, window, plugins_pg, parent=window)
 
-    for manifest in new_pm.discover():
-        if new_pm.load(manifest.id):
-            widget = new_pm.create_widget(manifest.id)
-            if widget is not None:
-                window.add_plugin_page(
-                    f"plugin_{manifest.id}", manifest.name,
-                    manifest.icon or "extension", widget,
-                    in_sidebar=new_pm.is_favorite(manifest.id),
-                )
-            new_pm.start(manifest.id)
+    _load_plugins(new_pm, window, start=True)
     plugins_pg.refresh()
-    return new_pm
+    return wiring
+
+
+def _load_plugins(pm, window, start: bool) -> None:
+    """Load every discovered plugin and add its page, in one pass on the GUI thread."""
+    for info in pm.snapshot_loadable():
+        if info.widget is not None:
+            window.add_plugin_page(f"plugin_{info.id}", info.name, info.icon,
+                                   info.widget, in_sidebar=info.in_sidebar)
+        if start:
+            pm.start(info.id)
 
 
 def _cascade_theme_to_plugins(pm, ctx) -> None:
     """Notify all loaded plugins that the theme has changed."""
-    for record in pm._records.values():
-        if record.plugin is not None:
-            try:
-                record.plugin.on_theme_changed(ctx.style)
-            except Exception as exc:
-                _log.debug("on_theme_changed failed for %s: %s", record.manifest.id, exc)
+    debug = _log.isEnabledFor(logging.DEBUG)
+    for pid, plugin in pm.iter_live_plugins():
+        try:
+            plugin.on_theme_changed(ctx.style)
+        except Exception as exc:
+            if debug:
+                _log.debug("on_theme_changed failed for %s: %s", pid, exc)
+
+
+def _qt_msg(mode, context, message):
+    global _qt_tokens, _qt_tokens_at
+    if mode != QtMsgType.QtFatalMsg:
+        key = (mode, message)
+        with _qt_msg_lock:
+            now = time.monotonic()
+            if now - _qt_last_seen.get(key, -_QT_DEDUPE_WINDOW_S) < _QT_DEDUPE_WINDOW_S:
+                return
+            # token bucket: refill at _QT_MSG_RATE/s, capped at one second's worth
+            _qt_tokens = min(float(_QT_MSG_RATE), _qt_tokens + (now - _qt_tokens_at) * _QT_MSG_RATE)
+            _qt_tokens_at = now
+            if _qt_tokens < 1.0:
+                return
+            _qt_tokens -= 1.0
+            if len(_qt_last_seen) >= _QT_SEEN_LIMIT:
+                for stale in [k for k, t in _qt_last_seen.items() if now - t >= _QT_DEDUPE_WINDOW_S]:
+                    del _qt_last_seen[stale]
+            _qt_last_seen[key] = now
+    _QT_MSG_DISPATCH.get(mode, _log.debug)("[Qt] %s", message)
+
+
+def _build_about_page(ctx):
+    from nova.pages.about_page import AboutPage
+    return AboutPage(ctx)
 
 
 # ---------------------------------------------------------------------------
@@ -153,20 +234,11 @@ def run(ctx) -> None:
 
     _apply_font_from_config(ctx.config, app)
 
-    nova_qss = Path(__file__).parent.parent / "resources" / "qss" / "nova.qss"
-    if nova_qss.exists():
-        ctx.style.apply_theme(app, nova_qss.read_text(encoding="utf-8"))
+    qss_text = read_qss(_QSS_PATH)
+    if qss_text is not None:
+        ctx.style.apply_theme(app, qss_text)
     else:
-        _log.warning("nova.qss not found at %s — running unstyled", nova_qss)
-
-    from PySide6.QtCore import qInstallMessageHandler, QtMsgType
-
-    def _qt_msg(mode, context, message):
-        if mode == QtMsgType.QtInfoMsg:     _log.info("[Qt] %s", message)
-        elif mode == QtMsgType.QtWarningMsg:  _log.warning("[Qt] %s", message)
-        elif mode == QtMsgType.QtCriticalMsg: _log.error("[Qt] %s", message)
-        elif mode == QtMsgType.QtFatalMsg:    _log.critical("[Qt] %s", message)
-        else:                                 _log.debug("[Qt] %s", message)
+        _log.warning("nova.qss not found at %s — running unstyled", _QSS_PATH)
 
     qInstallMessageHandler(_qt_msg)
 
@@ -175,9 +247,8 @@ def run(ctx) -> None:
 
     home      = HomePage(ctx)
     plugins_pg = PluginsPage(pm)
-    settings  = SettingsPage(ctx, pm)
+    settings  = SettingsPage(ctx, pm, qss_path=_QSS_PATH)
     log_pg    = LogPage(ctx)
-    about     = AboutPage(ctx)
 
     window = MainWindow(ctx, pm)
 
@@ -186,34 +257,27 @@ def run(ctx) -> None:
     window.add_separator()
     window.add_page("settings", "Settings", "settings", settings)
     window.add_page("logs",     "Logs",     "file",     log_pg)
-    window.add_page("about",    "About",    "info",     about)
+    # Log/settings/plugins pages must exist up front to receive records and
+    # signals; About is static, so it is only imported and built when first opened.
+    window.add_lazy_page("about", "About", "info", lambda: _build_about_page(ctx))
 
-    for manifest in pm.discover():
-        if pm.load(manifest.id):
-            widget = pm.create_widget(manifest.id)
-            if widget is not None:
-                window.add_plugin_page(
-                    f"plugin_{manifest.id}", manifest.name,
-                    manifest.icon or "extension", widget,
-                    in_sidebar=pm.is_favorite(manifest.id),
-                )
-            # pm.start(manifest.id)
+    _load_plugins(pm, window, start=False)
 
     plugins_pg.refresh()
-    _wire_pm_signals(pm, home, window, plugins_pg, settings)
+    wiring = _PluginManagerWiring(pm, home, window, plugins_pg, parent=window)
 
     # ── Style change: sidebar + plugin cards + plugin instances ───────────
     def _on_style_changed():
         window._sidebar.refresh_colors()
         plugins_pg.refresh_icons()
-        _cascade_theme_to_plugins(pm, ctx)
+        _cascade_theme_to_plugins(wiring.pm, ctx)
 
     settings.style_changed.connect(_on_style_changed)
 
     # ── Plugins path hot-reload ───────────────────────────────────────────
     def _on_plugins_path_changed(new_path: str):
-        nonlocal pm
-        pm = _do_plugin_hot_reload(ctx, new_path, pm, window, plugins_pg, settings, home)
+        nonlocal wiring
+        wiring = _do_plugin_hot_reload(ctx, new_path, wiring, window, plugins_pg, settings, home)
 
     settings.plugins_path_changed.connect(_on_plugins_path_changed)
 
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from PySide6.QtCore import QCoreApplication, QTimer
+
 _log = logging.getLogger(__name__)
 
 @dataclass
@@ -20,14 +23,26 @@ class SettingItem:
     group: str
     icon: str
 
+_SAVE_DEBOUNCE_MS = 250
+
+
 class ConfigManager:
     """
     Manages application configuration, loading/saving from a JSON file.
     Replaces qtpop.configuration.parser.ConfigurationManager
+
+    Changes made through set_value/add_user_setting are written after a
+    short quiet period, and on interpreter exit if still pending.
     """
     def __init__(self, config_path: Path):
         self._path = config_path
         self._data: Dict[str, Any] = {"user": {}, "static": {}}
+        # Derived from _data by _rebuild_cache(); user values shadow static ones
+        self._flat: Dict[str, Any] = {}
+        self._settings_cache: Dict[str, SettingItem] = {}
+        self._dirty = False
+        self._flush_timer: Optional[QTimer] = None  # created once a Qt app exists
+        atexit.register(self._flush_now)
         self.load()
 
     def load(self):
@@ -47,8 +62,26 @@ class ConfigManager:
                     self._data = raw_data # Fallback/Legacy support if needed
         except Exception as e:
             _log.error(f"Failed to load config: {e}")
+        self._rebuild_cache()
+
+    def _rebuild_cache(self):
+        """Flatten _data into raw values and parsed SettingItems, once per change."""
+        flat: Dict[str, Any] = dict(self._data.get("static", {}))
+        settings: Dict[str, SettingItem] = {}
+        for k, v in self._data.get("user", {}).items():
+            if isinstance(v, dict) and "value" in v:
+                flat[k] = v["value"]
+                try:
+                    settings[k] = SettingItem(**v)
+                except Exception:
+                    pass
+            else:
+                flat[k] = v
+        self._flat = flat
+        self._settings_cache = settings
 
     def save(self):
+        self._dirty = False
         try:
             # Wrap in "configuration" key to match typical qtpop structure if we want compatibility
             output = {"configuration": self._data}
@@ -57,18 +90,29 @@ class ConfigManager:
         except Exception as e:
             _log.error(f"Failed to save config: {e}")
 
+    def _schedule_save(self):
+        """Coalesce bursts of changes into one write once they stop arriving."""
+        self._dirty = True
+        if self._flush_timer is None:
+            if QCoreApplication.instance() is None:
+                self.save()  # no event loop to defer to
+                return
+            self._flush_timer = QTimer()
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.setInterval(_SAVE_DEBOUNCE_MS)
+            self._flush_timer.timeout.connect(self._flush_now)
+        self._flush_timer.start()
+
+    def _flush_now(self):
+        if self._dirty:
+            self.save()
+
     def get_value(self, key: str, default=None) -> Any:
         """Return the raw value for *key* (not the whole SettingItem dict)."""
-        user_settings = self._data.get("user", {})
-        if key in user_settings:
-            val = user_settings[key]
-            if isinstance(val, dict) and "value" in val:
-                return val["value"]   # return raw value, not SettingItem
-            return val
-
-        static_settings = self._data.get("static", {})
-        if key in static_settings:
-            return static_settings[key]
+        try:
+            return self._flat[key]
+        except KeyError:
+            pass
 
         if default is not None:
             return default
@@ -77,25 +121,11 @@ class ConfigManager:
 
     def get_setting(self, key: str) -> Optional[SettingItem]:
         """Return a SettingItem for *key* (user settings only), or None."""
-        user = self._data.get("user", {})
-        val = user.get(key)
-        if isinstance(val, dict) and "value" in val:
-            try:
-                return SettingItem(**val)
-            except Exception:
-                return None
-        return None
+        return self._settings_cache.get(key)
 
     def get_all_user_settings(self) -> Dict[str, SettingItem]:
         """Return all user settings that can be parsed as SettingItem objects."""
-        out: Dict[str, SettingItem] = {}
-        for k, v in self._data.get("user", {}).items():
-            if isinstance(v, dict) and "value" in v:
-                try:
-                    out[k] = SettingItem(**v)
-                except Exception:
-                    pass
-        return out
+        return dict(self._settings_cache)
 
     def set_value(self, key: str, value: Any):
         # We only set user settings
@@ -115,9 +145,11 @@ class ConfigManager:
         else:
             # If creating new simple value
             user_settings[key] = value
-            
-        self.save()
+
+        self._rebuild_cache()
+        self._schedule_save()
 
     def add_user_setting(self, key: str, item: SettingItem):
         self._data.setdefault("user", {})[key] = asdict(item)
-        self.save()
+        self._rebuild_cache()
+        self._schedule_save()
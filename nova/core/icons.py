@@ -9,6 +9,8 @@ from PySide6.QtSvg import QSvgRenderer
 
 _log = logging.getLogger(__name__)
 
+_PIXMAP_CACHE_SIZE = 512
+
 
 class IconManager:
     """
@@ -17,11 +19,16 @@ class IconManager:
     """
 
     _instance: Optional["IconManager"] = None
+    # Rendered results keyed by (svg_str, color, size); oldest entries are evicted first
+    _pix_cache: dict[tuple[str, str, int], QPixmap] = {}
+    # Parsed renderers keyed by svg_str, so each SVG document is parsed once
+    _renderer_cache: dict[str, QSvgRenderer] = {}
+    # Untinted rasterisations keyed by (svg_str, size); tinting a copy skips the SVG render
+    _mask_cache: dict[tuple[str, int], QImage] = {}
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._icon_cache: dict[str, QImage] = {}
         return cls._instance
 
     # ------------------------------------------------------------------
@@ -45,22 +52,50 @@ class IconManager:
 
         return cls.render_svg_string(svg_str, color, size)
 
-    @staticmethod
-    def render_svg_string(svg_str: str, color: str = "#FFFFFF", size: int = 24) -> Optional[QPixmap]:
+    @classmethod
+    def render_svg_string(cls, svg_str: str, color: str = "#FFFFFF", size: int = 24) -> Optional[QPixmap]:
         """Render an SVG string to a solid-colour QPixmap (SourceIn compositing)."""
-        data = QByteArray(svg_str.encode())
-        renderer = QSvgRenderer(data)
-        if not renderer.isValid():
-            _log.warning("Invalid SVG data passed to render_svg_string")
-            return None
+        key = (svg_str, color, size)
+        pixmap = cls._pix_cache.get(key)
+        if pixmap is not None:
+            return pixmap
 
-        img = QImage(size, size, QImage.Format_ARGB32)
-        img.fill(Qt.transparent)
+        mask = cls._mask_cache.get((svg_str, size))
+        if mask is None:
+            mask = cls._render_mask(svg_str, size)
+            if mask is None:
+                return None
 
+        img = mask.copy()
         painter = QPainter(img)
-        renderer.render(painter)
         painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
         painter.fillRect(img.rect(), QColor(color))
         painter.end()
 
-        return QPixmap.fromImage(img)
+        pixmap = QPixmap.fromImage(img)
+        if len(cls._pix_cache) >= _PIXMAP_CACHE_SIZE:
+            del cls._pix_cache[next(iter(cls._pix_cache))]
+        cls._pix_cache[key] = pixmap
+        return pixmap
+
+    @classmethod
+    def _render_mask(cls, svg_str: str, size: int) -> Optional[QImage]:
+        """Rasterise *svg_str* once per size; only its alpha matters for tinting."""
+        renderer = cls._renderer_cache.get(svg_str)
+        if renderer is None:
+            renderer = QSvgRenderer(QByteArray(svg_str.encode()))
+            if not renderer.isValid():
+                _log.warning("Invalid SVG data passed to render_svg_string")
+                return None
+            cls._renderer_cache[svg_str] = renderer
+
+        mask = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+        mask.fill(Qt.transparent)
+        painter = QPainter(mask)
+        renderer.render(painter)
+        painter.end()
+
+        if len(cls._mask_cache) >= _PIXMAP_CACHE_SIZE:
+            del cls._mask_cache[next(iter(cls._mask_cache))]
+        cls._mask_cache[(svg_str, size)] = mask
+        return mask
@@ -9,8 +9,12 @@ from typing import Any
 
 from PySide6.QtWidgets import QWidget
 
+# Parsed manifests: path -> (mtime_ns, manifest). One entry per plugin.json;
+# an edited file replaces its entry instead of adding another.
+_MANIFEST_CACHE: dict[str, tuple[int, "PluginManifest"]] = {}
 
-@dataclass
+
+@dataclass(frozen=True)
 class PluginManifest:
     id: str
     name: str
@@ -23,8 +27,13 @@ class PluginManifest:
 
     @classmethod
     def from_file(cls, path: Path) -> "PluginManifest":
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return cls(
+        key = str(path)
+        mtime = path.stat().st_mtime_ns
+        cached = _MANIFEST_CACHE.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        data = json.loads(path.read_bytes())
+        manifest = cls(
             id=data["id"],
             name=data["name"],
             version=data.get("version", "0.1.0"),
@@ -34,6 +43,8 @@ class PluginManifest:
             entry=data.get("entry", "plugin_main.Plugin"),
             thread_isolated=data.get("thread_isolated", True),
         )
+        _MANIFEST_CACHE[key] = (mtime, manifest)
+        return manifest
 
 
 @dataclass
@@ -105,3 +116,8 @@ class PluginBase(ABC):
         """Convenience: worker side sends data to the host."""
         if self._bridge is not None:
             self._bridge.send_data(key, value)
+
+    def send_bytes(self, key: str, buf: bytes | bytearray | memoryview) -> None:
+        """Worker side sends a binary payload via shared memory; on_data gets bytes."""
+        if self._bridge is not None:
+            self._bridge.send_bytes(key, buf)
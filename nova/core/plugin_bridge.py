@@ -2,13 +2,120 @@ from __future__ import annotations
 
 import json
 import logging
+import socket
+import struct
+import sys
+import threading
+import uuid
 from typing import Any
 
-from PySide6.QtCore import QObject, Signal, QTimer
+from PySide6.QtCore import QCoreApplication, QObject, QSharedMemory, QThread, Signal, QTimer
 from PySide6.QtNetwork import QLocalServer, QLocalSocket
 
 _log = logging.getLogger(__name__)
 
+# Wire format: a 5-byte header (big-endian payload length, one kind byte)
+# followed by the UTF-8 JSON payload.  The kind lives outside the JSON so the
+# reader can route a frame without probing a "type" key.
+_HEADER = struct.Struct(">IB")
+_DATA = ord("D")     # payload: [key, value]
+_EVENT = ord("E")    # payload: {"name": ..., "data": {...}}
+_COMMAND = ord("C")  # payload: {"cmd": ..., "data": {...}}
+# json.dumps() builds a fresh encoder whenever it is given options; keep one.
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+# Outgoing frames are coalesced for _FLUSH_INTERVAL_MS, or until
+# _FLUSH_BATCH of them are queued, and written with a single call.
+_FLUSH_INTERVAL_MS = 2
+_FLUSH_BATCH = 128
+# Writes are left for Qt to drain from the event loop; an explicit flush()
+# is only forced for control messages or once this many bytes are queued.
+_FLUSH_NOW_BYTES = 32 * 1024
+
+# Kernel send/receive buffer requested for the Unix-domain socket so bulk
+# payloads arrive in fewer, larger reads (the kernel may clamp it).
+_SOCKET_BUFFER_BYTES = 1 << 20
+
+# WorkerBridge reconnect backoff: first retry after _RETRY_MIN_MS, doubling
+# up to _RETRY_MAX_MS while the host server is not listening yet.
+_RETRY_MIN_MS = 10
+_RETRY_MAX_MS = 1000
+
+# Upper bound on how long a stopping worker waits for its plugin thread to
+# return from start() before quitting anyway.
+_STOP_GRACE_MS = 400
+# How long a quitting worker blocks to hand queued frames to the kernel.
+_DRAIN_TIMEOUT_MS = 1000
+
+# Marker key of a data value whose bytes travel through a QSharedMemory
+# segment; the frame itself only carries the segment name and size.
+_SHM_KEY = "__shm__"
+
+
+def _frame(kind: int, payload: Any) -> bytes:
+    """Encode *payload* as one frame of the given *kind*."""
+    body = _encode(payload).encode("utf-8")
+    return _HEADER.pack(len(body), kind) + body
+
+
+def _tune_socket_buffers(conn: QLocalSocket) -> None:
+    """Raise the kernel buffers of a connected local socket where possible."""
+    if sys.platform == "win32":
+        return  # named pipe: buffer size is fixed by the server end
+    fd = int(conn.socketDescriptor())
+    if fd < 0:
+        return
+    try:
+        # fromfd() dups the descriptor, so closing the wrapper is harmless.
+        with socket.fromfd(fd, socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_BUFFER_BYTES)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_BUFFER_BYTES)
+    except OSError as exc:
+        _log.debug("plugin_bridge: could not resize socket buffers: %s", exc)
+
+
+class _FrameReader:
+    """Reassembles length-prefixed frames from arbitrary socket reads.
+
+    Data accumulates in one bytearray and a read cursor walks over it;
+    consumed bytes are only dropped once the cursor passes _COMPACT_AT (or
+    the buffer drains), so a large burst is not re-copied per frame.
+    """
+
+    _COMPACT_AT = 64 * 1024
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._pos = 0
+
+    def feed(self, data: bytes) -> list[tuple[int, Any]]:
+        """Append *data* and return (kind, payload) for every completed frame."""
+        buf = self._buf
+        buf += data
+        msgs = []
+        hsize = _HEADER.size
+        pos = self._pos
+        while len(buf) - pos >= hsize:
+            size, kind = _HEADER.unpack_from(buf, pos)
+            end = pos + hsize + size
+            if len(buf) < end:
+                break
+            body = buf[pos + hsize:end]
+            pos = end
+            try:
+                msgs.append((kind, json.loads(body)))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                _log.warning("plugin_bridge: bad frame: %r", bytes(body[:80]))
+        if pos == len(buf):
+            buf.clear()
+            pos = 0
+        elif pos > self._COMPACT_AT:
+            del buf[:pos]
+            pos = 0
+        self._pos = pos
+        return msgs
+
+
 # ─────────────────────────────────────────────────────────────
 #  MainBridge  —  lives in the HOST process (wraps QLocalServer)
 # ─────────────────────────────────────────────────────────────
@@ -30,7 +137,13 @@ class MainBridge(QObject):
         self._socket_name = socket_name
         self._server = QLocalServer(self)
         self._conn: QLocalSocket | None = None
-        self._buf = b""
+        self._reader = _FrameReader()
+        self._out_queue: list[bytes] = []
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_out)
 
         self._server.newConnection.connect(self._on_new_connection)
         QLocalServer.removeServer(socket_name)
@@ -43,6 +156,7 @@ class MainBridge(QObject):
         self._conn = self._server.nextPendingConnection()
         if self._conn is None:
             return
+        _tune_socket_buffers(self._conn)
         self._conn.readyRead.connect(self._on_ready_read)
         self._conn.disconnected.connect(self._on_disconnected)
         _log.debug("MainBridge: worker connected on '%s'", self._socket_name)
@@ -51,28 +165,43 @@ class MainBridge(QObject):
     def _on_ready_read(self):
         if self._conn is None:
             return
-        self._buf += bytes(self._conn.readAll())
-        while b"\n" in self._buf:
-            line, self._buf = self._buf.split(b"\n", 1)
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                msg = json.loads(line.decode("utf-8"))
-            except json.JSONDecodeError:
-                _log.warning("MainBridge: bad JSON: %r", line)
-                continue
-            self._dispatch(msg)
-
-    def _dispatch(self, msg: dict):
-        t = msg.get("type")
-        if t == "data":
-            self.data_received.emit(msg.get("key", ""), msg.get("value"))
-        elif t == "event":
+        for kind, payload in self._reader.feed(self._conn.readAll().data()):
+            if kind == _DATA:
+                key, value = payload
+                if isinstance(value, dict) and _SHM_KEY in value:
+                    value = self._read_shared(value)
+                self.data_received.emit(key, value)
+            else:
+                self._dispatch(kind, payload)
+
+    def _dispatch(self, kind: int, msg: dict):
+        if kind == _EVENT:
             if msg.get("name") == "ready":
                 self.worker_ready.emit()
         else:
-            _log.debug("MainBridge: unknown msg type '%s'", t)
+            _log.debug("MainBridge: unknown frame kind %r", chr(kind))
+
+    def _read_shared(self, ref: dict) -> bytes:
+        """Copy a worker's shared-memory payload out and release the segment."""
+        name = ref.get(_SHM_KEY) or ""
+        size = int(ref.get("size", 0))
+        if not name or size <= 0:
+            return b""
+        shm = QSharedMemory(name)
+        if not shm.attach(QSharedMemory.ReadOnly):
+            _log.warning("MainBridge: cannot attach shared memory '%s': %s",
+                         name, shm.errorString())
+            return b""
+        try:
+            shm.lock()
+            try:
+                data = memoryview(shm.constData())[:size].tobytes()
+            finally:
+                shm.unlock()
+        finally:
+            shm.detach()
+        self.send_command("shm_free", {"name": name})
+        return data
 
     def _on_disconnected(self):
         _log.debug("MainBridge: worker disconnected")
@@ -83,15 +212,37 @@ class MainBridge(QObject):
 
     # ------------------------------------------------------------------
     def send_command(self, cmd: str, data: dict | None = None):
-        """Send a JSON command to the worker subprocess."""
+        """
+        Queue a command frame for the worker subprocess.
+
+        Commands are batched briefly; 'stop' is written straight away because
+        callers may block on the worker exiting right after sending it.
+        """
         if self._conn is None or self._conn.state() != QLocalSocket.ConnectedState:
             _log.debug("MainBridge: no connected worker to send command '%s'", cmd)
             return
-        payload = json.dumps({"type": "command", "cmd": cmd, "data": data or {}}) + "\n"
-        self._conn.write(payload.encode("utf-8"))
-        self._conn.flush()
+        self._out_queue.append(_frame(_COMMAND, {"cmd": cmd, "data": data or {}}))
+        if cmd == "stop":
+            self._flush_out(force=True)
+        elif len(self._out_queue) >= _FLUSH_BATCH:
+            self._flush_out()
+        elif not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_out(self, force: bool = False):
+        self._flush_timer.stop()
+        if not self._out_queue:
+            return
+        payload = b"".join(self._out_queue)
+        self._out_queue.clear()
+        if self._conn is None or self._conn.state() != QLocalSocket.ConnectedState:
+            return
+        self._conn.write(payload)
+        if force or len(payload) >= _FLUSH_NOW_BYTES:
+            self._conn.flush()
 
     def close(self):
+        self._flush_out(force=True)
         if self._conn:
             try:
                 self._conn.disconnectFromServer()
@@ -115,59 +266,156 @@ class WorkerBridge(QObject):
     """
 
     command_received = Signal(str, object)  # cmd, data
+    _out_pending = Signal()  # frames queued by _write (may fire off-thread)
 
     def __init__(self, socket_name: str, parent: QObject | None = None):
         super().__init__(parent)
         self._socket_name = socket_name
         self._plugin = None
-        self._buf = b""
+        self._plugin_thread: QThread | None = None
+        self._reader = _FrameReader()
         self._shutting_down = False
+        self._out_queue: list[bytes] = []
+        self._out_lock = threading.Lock()
+        self._shm_segments: dict[str, QSharedMemory] = {}
 
         self._socket = QLocalSocket(self)
+        self._socket.connected.connect(self._on_connected)
         self._socket.readyRead.connect(self._on_ready_read)
         self._socket.disconnected.connect(self._on_disconnected)
         self._socket.errorOccurred.connect(self._on_error)
 
+        self._retry_delay = _RETRY_MIN_MS
         self._retry_timer = QTimer(self)
-        self._retry_timer.setInterval(300)
+        self._retry_timer.setSingleShot(True)
         self._retry_timer.timeout.connect(self._try_connect)
-        self._retry_timer.start()
+        self._retry_timer.start(self._retry_delay)
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_out)
+        self._out_pending.connect(self._schedule_flush)
 
     def set_plugin(self, plugin) -> None:
         self._plugin = plugin
 
+    def set_plugin_thread(self, thread: QThread) -> None:
+        """Quit the worker as soon as *thread* (running plugin.start()) ends."""
+        self._plugin_thread = thread
+        thread.finished.connect(self._on_plugin_finished)
+
+    def _on_plugin_finished(self) -> None:
+        _log.debug("WorkerBridge: plugin thread finished, quitting event loop")
+        self._quit()
+
+    def _quit(self) -> None:
+        """Write out every queued frame, then stop the worker's event loop.
+
+        Frames sent right before start() returns are still waiting for the
+        flush timer, which never fires once the loop has quit.
+        """
+        self._flush_out(force=True)
+        if self._socket.state() == QLocalSocket.ConnectedState:
+            while (self._socket.bytesToWrite() > 0
+                   and self._socket.waitForBytesWritten(_DRAIN_TIMEOUT_MS)):
+                pass
+        QCoreApplication.quit()
+
     # ------------------------------------------------------------------
     def send_data(self, key: str, value: Any) -> None:
-        payload = json.dumps({"type": "data", "key": key, "value": value}) + "\n"
-        self._write(payload.encode("utf-8"))
+        self._write(_frame(_DATA, [key, value]))
+
+    def send_bytes(self, key: str, buf: bytes | bytearray | memoryview) -> None:
+        """
+        Send a binary payload through a shared-memory segment.
+
+        Only the segment name travels over the socket; the host copies the
+        bytes out, emits them as the value for *key* and replies with
+        'shm_free' so the segment can be released here.
+        """
+        view = memoryview(buf).cast("B")
+        size = view.nbytes
+        if size == 0:
+            self._write(_frame(_DATA, [key, {_SHM_KEY: "", "size": 0}]))
+            return
+        name = f"{self._socket_name}-{uuid.uuid4().hex}"
+        shm = QSharedMemory(name)
+        if not shm.create(size):
+            _log.warning("WorkerBridge: cannot create shared memory for '%s': %s",
+                         key, shm.errorString())
+            return
+        shm.lock()
+        try:
+            memoryview(shm.data())[:size] = view
+        finally:
+            shm.unlock()
+        self._shm_segments[name] = shm
+        self._write(_frame(_DATA, [key, {_SHM_KEY: name, "size": size}]))
+
+    def _release_shared(self, name: str) -> None:
+        shm = self._shm_segments.pop(name, None)
+        if shm is not None:
+            shm.detach()
 
     def send_event(self, name: str, data: dict | None = None) -> None:
-        payload = json.dumps({"type": "event", "name": name, "data": data or {}}) + "\n"
-        self._write(payload.encode("utf-8"))
+        self._write(_frame(_EVENT, {"name": name, "data": data or {}}))
 
     def _write(self, raw: bytes) -> None:
+        # Plugins call this from their worker QThread, so frames are only
+        # queued here; the socket itself is written on the bridge's thread.
         if self._socket.state() != QLocalSocket.ConnectedState:
             _log.debug("WorkerBridge: not yet connected, dropping message")
             return
-        self._socket.write(raw)
-        self._socket.flush()
+        with self._out_lock:
+            self._out_queue.append(raw)
+            pending = len(self._out_queue)
+        if pending == 1 or pending >= _FLUSH_BATCH:
+            self._out_pending.emit()
+
+    def _schedule_flush(self) -> None:
+        with self._out_lock:
+            pending = len(self._out_queue)
+        if pending >= _FLUSH_BATCH:
+            self._flush_out()
+        elif pending and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_out(self, force: bool = False) -> None:
+        self._flush_timer.stop()
+        with self._out_lock:
+            if not self._out_queue:
+                return
+            payload = b"".join(self._out_queue)
+            self._out_queue.clear()
+        if self._socket.state() != QLocalSocket.ConnectedState:
+            return
+        self._socket.write(payload)
+        if force or len(payload) >= _FLUSH_NOW_BYTES:
+            self._socket.flush()
 
     # ------------------------------------------------------------------
     def _try_connect(self) -> None:
         if self._shutting_down:
-            self._retry_timer.stop()
             return
         state = self._socket.state()
         if state == QLocalSocket.ConnectedState:
-            self._retry_timer.stop()
             return
         if state != QLocalSocket.UnconnectedState:
             self._socket.abort()
         self._socket.connectToServer(self._socket_name)
-        if self._socket.state() == QLocalSocket.ConnectedState:
-            self._retry_timer.stop()
-            _log.debug("WorkerBridge: connected to '%s'", self._socket_name)
-            self.send_event("ready", {})
+        if self._socket.state() != QLocalSocket.ConnectedState:
+            # Back off; a successful connect stops the timer via _on_connected.
+            self._retry_delay = min(self._retry_delay * 2, _RETRY_MAX_MS)
+            self._retry_timer.start(self._retry_delay)
+
+    def _on_connected(self) -> None:
+        self._retry_timer.stop()
+        self._retry_delay = _RETRY_MIN_MS
+        _tune_socket_buffers(self._socket)
+        _log.debug("WorkerBridge: connected to '%s'", self._socket_name)
+        self.send_event("ready", {})
+        self._flush_out(force=True)
 
     def _on_error(self, err) -> None:
         from PySide6.QtNetwork import QLocalSocket as _S
@@ -177,18 +425,12 @@ class WorkerBridge(QObject):
             _log.warning("WorkerBridge socket error: %s", err)
 
     def _on_ready_read(self) -> None:
-        self._buf += bytes(self._socket.readAll())
-        while b"\n" in self._buf:
-            line, self._buf = self._buf.split(b"\n", 1)
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                msg = json.loads(line.decode("utf-8"))
-            except json.JSONDecodeError:
-                continue
-            if msg.get("type") == "command":
+        for kind, msg in self._reader.feed(self._socket.readAll().data()):
+            if kind == _COMMAND:
                 cmd = msg.get("cmd", "")
+                if cmd == "shm_free":
+                    self._release_shared(msg.get("data", {}).get("name", ""))
+                    continue
                 self.command_received.emit(cmd, msg.get("data", {}))
                 if cmd == "stop":
                     self._handle_stop()
@@ -205,10 +447,15 @@ class WorkerBridge(QObject):
                 self._plugin.stop()
             except Exception as exc:
                 _log.warning("WorkerBridge: plugin.stop() raised: %s", exc)
+        self._flush_out(force=True)
 
-        # Give the plugin thread a moment to notice the stop flag, then quit.
-        from PySide6.QtCore import QCoreApplication
-        QTimer.singleShot(400, QCoreApplication.quit)
+        # The thread's finished signal quits as soon as start() returns; the
+        # timer only caps the wait for plugins slow to notice the stop flag.
+        thread = self._plugin_thread
+        if thread is None or not thread.isRunning():
+            self._quit()
+        else:
+            QTimer.singleShot(_STOP_GRACE_MS, self._quit)
 
     def _on_disconnected(self) -> None:
         _log.debug("WorkerBridge: host disconnected")
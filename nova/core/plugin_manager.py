@@ -6,9 +6,10 @@ import shutil
 import sys
 import uuid
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 
 from PySide6.QtCore import QObject, Signal, QProcess, QTimer
 from PySide6.QtWidgets import QWidget
@@ -21,6 +22,16 @@ from nova.core.plugin_state import PluginStateManager
 _log = logging.getLogger(__name__)
 
 _MAX_RESTARTS = 3
+_DISCOVER_WORKERS = 4
+
+
+class PluginStartInfo(NamedTuple):
+    """What the shell needs to add a freshly loaded plugin's page."""
+    id: str
+    name: str
+    icon: str
+    widget: Optional[QWidget]
+    in_sidebar: bool
 
 
 @dataclass
@@ -56,6 +67,10 @@ class PluginManager(QObject):
         self._config = ctx.config
         self._plugins_dir = plugins_dir
         self._records: Dict[str, _PluginRecord] = {}
+        # Manifests from the last discover(), so load() doesn't rescan per plugin
+        self._manifests: Dict[str, PluginManifest] = {}
+        # (plugin_id, instance) for records with a live plugin; None until rebuilt
+        self._live_plugins: Optional[Tuple[Tuple[str, PluginBase], ...]] = None
         # Track intentional stops so we don't mistake them for crashes.
         # On Windows, QProcess::terminate() causes CrashExit status.
         self._intentional_stops: Set[str] = set()
@@ -74,13 +89,25 @@ class PluginManager(QObject):
         if not self._plugins_dir.exists():
             _log.warning("PluginManager: plugins directory not found: %s", self._plugins_dir)
             return manifests
-        for json_file in sorted(self._plugins_dir.rglob("plugin.json")):
+        json_files = sorted(self._plugins_dir.rglob("plugin.json"))
+
+        def _read(json_file: Path):
             try:
-                m = PluginManifest.from_file(json_file)
-                manifests.append(m)
-                _log.debug("PluginManager: discovered plugin '%s'", m.id)
+                return PluginManifest.from_file(json_file)
             except Exception as exc:
-                _log.warning("PluginManager: failed to load manifest %s: %s", json_file, exc)
+                return exc
+
+        # Manifest reads are plain file I/O + JSON parsing; overlap them, keep scan order
+        with ThreadPoolExecutor(max_workers=_DISCOVER_WORKERS) as pool:
+            results = list(pool.map(_read, json_files))
+
+        for json_file, result in zip(json_files, results):
+            if isinstance(result, Exception):
+                _log.warning("PluginManager: failed to load manifest %s: %s", json_file, result)
+                continue
+            manifests.append(result)
+            _log.debug("PluginManager: discovered plugin '%s'", result.id)
+        self._manifests = {m.id: m for m in manifests}
         return manifests
 
     # ──────────────────────────────────────────────────────────
@@ -92,12 +119,12 @@ class PluginManager(QObject):
         if plugin_id in self._records:
             return True
 
-        # Find manifest
-        manifest: Optional[PluginManifest] = None
-        for m in self.discover():
-            if m.id == plugin_id:
-                manifest = m
-                break
+        # _manifests is the one source; import/reload/delete keep it current and
+        # a miss (e.g. after reload_plugin invalidated the entry) triggers a rescan.
+        manifest = self._manifests.get(plugin_id)
+        if manifest is None:
+            self.discover()
+            manifest = self._manifests.get(plugin_id)
         if manifest is None:
             _log.error("PluginManager: manifest not found for '%s'", plugin_id)
             return False
@@ -150,10 +177,24 @@ class PluginManager(QObject):
 
         record.plugin = plugin_inst
         record.bridge = bridge
+        self._live_plugins = None
         self.plugin_loaded.emit(plugin_id)
         _log.info("PluginManager: loaded plugin '%s'", plugin_id)
         return True
 
+    def snapshot_loadable(self) -> List[PluginStartInfo]:
+        """Discover, load and create widgets for every plugin in one pass."""
+        infos: List[PluginStartInfo] = []
+        for manifest in self.discover():
+            pid = manifest.id
+            if not self.load(pid):
+                continue
+            infos.append(PluginStartInfo(
+                pid, manifest.name, manifest.icon or "extension",
+                self.create_widget(pid), self.is_favorite(pid),
+            ))
+        return infos
+
     # ──────────────────────────────────────────────────────────
     #  Starting / Stopping
     # ──────────────────────────────────────────────────────────
@@ -356,6 +397,7 @@ class PluginManager(QObject):
                 return False, f"Plugin '{manifest.id}' already exists"
             target_dir.rename(new_dir)
 
+        self._manifests[manifest.id] = manifest
         _log.info("PluginManager: imported plugin '%s' from %s", manifest.id, zip_path)
         self.plugin_imported.emit(manifest.id)
         return True, manifest.id
@@ -400,6 +442,7 @@ class PluginManager(QObject):
 
         # Remove record and clean up Qt objects
         record = self._records.pop(plugin_id, None)
+        self._live_plugins = None
         if record:
             if record.bridge:
                 try:
@@ -419,6 +462,7 @@ class PluginManager(QObject):
                     pass
 
         # Remove persisted state
+        self._manifests.pop(plugin_id, None)
         self._state.remove(plugin_id)
 
         # Delete the plugin directory
@@ -447,6 +491,7 @@ class PluginManager(QObject):
 
         # Drop the old record (close bridge)
         record = self._records.pop(plugin_id, None)
+        self._live_plugins = None
         if record and record.bridge:
             try:
                 record.bridge.close()
@@ -454,6 +499,9 @@ class PluginManager(QObject):
                 pass
             record.bridge.deleteLater()
 
+        # Drop the cached manifest so load() rescans and picks up an edited plugin.json
+        self._manifests.pop(plugin_id, None)
+
         # Generate a fresh socket name on reload
         if not self.load(plugin_id):
             return False
@@ -476,6 +524,21 @@ class PluginManager(QObject):
     def manifests(self) -> List[PluginManifest]:
         return [r.manifest for r in self._records.values()]
 
+    def get_record(self, plugin_id: str) -> Optional[_PluginRecord]:
+        return self._records.get(plugin_id)
+
+    def get_manifest(self, plugin_id: str) -> Optional[PluginManifest]:
+        rec = self._records.get(plugin_id)
+        return rec.manifest if rec is not None else None
+
+    def iter_live_plugins(self) -> Iterable[Tuple[str, PluginBase]]:
+        """(plugin_id, instance) for every loaded plugin; snapshot reused until records change."""
+        if self._live_plugins is None:
+            self._live_plugins = tuple(
+                (pid, rec.plugin) for pid, rec in self._records.items() if rec.plugin is not None
+            )
+        return self._live_plugins
+
     def loaded_count(self) -> int:
         return len(self._records)
 
@@ -550,5 +613,5 @@ class PluginManager(QObject):
         except RuntimeError:
             return  # C++ QProcess already deleted (e.g. during stop_all teardown)
         for line in data.splitlines():
-            if line.strip():
+            if line and not line.isspace():
                 _log.debug("[plugin:%s] %s", plugin_id, line)
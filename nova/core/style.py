@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import logging
+import re
 from pathlib import Path
-from typing import Dict, Union, Optional
+from typing import Dict, List, Union, Optional
 
 from PySide6.QtGui import QColor, QPalette
 from PySide6.QtWidgets import QApplication
@@ -11,6 +12,38 @@ _log = logging.getLogger(__name__)
 
 ColourLike = Union[str, QColor]
 
+_TOKEN_RE = re.compile(r"<([a-zA-Z0-9_]+)>")
+_qss_file_cache: Dict[str, tuple] = {}         # path -> (mtime_ns, text)
+_qss_templates: Dict[str, List[str]] = {}      # qss source -> [literal, token, literal, ...]
+_MAX_QSS_TEMPLATES = 4
+
+
+def read_qss(path: Path) -> Optional[str]:
+    """Return the text of *path*, re-reading only when its mtime changes; None if missing."""
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    cached = _qss_file_cache.get(str(path))
+    if cached is None or cached[0] != mtime:
+        # Raw bytes + one decode: Qt's QSS parser copes with either newline style,
+        # so text-mode newline translation is skipped
+        cached = (mtime, path.read_bytes().decode("utf-8"))
+        _qss_file_cache[str(path)] = cached
+    return cached[1]
+
+
+def _qss_template(qss_content: str) -> List[str]:
+    """Split QSS once into literals (even indices) and <token> names (odd indices)."""
+    parts = _qss_templates.get(qss_content)
+    if parts is None:
+        if len(_qss_templates) >= _MAX_QSS_TEMPLATES:
+            _qss_templates.clear()
+        parts = _TOKEN_RE.split(qss_content)
+        _qss_templates[qss_content] = parts
+    return parts
+
+
 class StyleManager:
     """
     Manages application theme colors.
@@ -25,6 +58,8 @@ class StyleManager:
             cls._instance._palette = None
             cls._instance._resolved_mode = "light"
             cls._instance._font_family = '"Segoe UI", "Roboto", sans-serif'
+            cls._instance._theme_args = None    # (accent, requested theme) of the last initialise()
+            cls._instance._applied_sig = None   # (theme args, font family) of the last apply_theme()
         return cls._instance
 
     @classmethod
@@ -41,9 +76,19 @@ class StyleManager:
     def get_font_family(cls) -> str:
         return getattr(cls(), '_font_family', '"Segoe UI", "Roboto", sans-serif')
 
+    @classmethod
+    def reapply(cls, app: QApplication, accent_hex: str, theme: str, qss_content: str) -> bool:
+        """Re-initialise and apply the theme unless it is already applied. Returns True if it was re-applied."""
+        if cls()._applied_sig == ((accent_hex, theme), cls.get_font_family()):
+            return False
+        cls.initialise(accent_hex, theme=theme)
+        cls.apply_theme(app, qss_content)
+        return True
+
     @classmethod
     def initialise(cls, accent_hex: str, support_hex: str = "#FF9800", neutral_hex: str = "#4CAF50", theme: str = "dark"):
         inst = cls()
+        theme_args = (accent_hex, theme)
         try:
             accent = cls._to_qcolor(accent_hex)
             support = cls._to_qcolor(support_hex)
@@ -137,6 +182,12 @@ class StyleManager:
                 "ctrl_bg_hover": ctrl_bg_hover,
                 "ctrl_fg":       ctrl_fg,
             })
+
+            # Plugin status colours (theme-independent); nova.qss and PluginCard both read these
+            inst._colours.update({
+                "status_running": QColor(0x22, 0xC5, 0x5E),
+                "status_crashed": QColor(0xEF, 0x44, 0x44),
+            })
             
             # Build palette (simplified)
             p = QPalette()
@@ -150,6 +201,7 @@ class StyleManager:
             p.setColor(QPalette.Highlight, accent)
             p.setColor(QPalette.HighlightedText, white)
             inst._palette = p
+            inst._theme_args = theme_args
 
         except Exception as e:
             _log.error(f"StyleManager init failed: {e}")
@@ -220,28 +272,29 @@ class StyleManager:
     @classmethod
     def apply_theme(cls, app: QApplication, qss_content: str):
         """Process QSS and apply to app."""
-        import re
-
         # 1. Font-family token (not a colour)
-        processed_qss = qss_content.replace("<font_family>", cls.get_font_family())
+        values: Dict[str, str] = {"font_family": cls.get_font_family()}
 
         # 2. SVG icon file paths for url() references in QSS
         try:
-            url_map = cls._write_qss_icons()
-            for token, posix_path in url_map.items():
-                processed_qss = processed_qss.replace(f"<{token}>", posix_path)
+            values.update(cls._write_qss_icons())
         except Exception as e:
             _log.warning(f"Could not write QSS icon files: {e}")
 
-        # 3. Colour tokens <token>
-        def repl(m):
-            key = m.group(1)
-            return cls.get_colour(key)
-
-        processed_qss = re.sub(r"<([a-zA-Z0-9_]+)>", repl, processed_qss)
+        # 3. Colour tokens <token>; the source is tokenised once, only values are re-substituted
+        parts = list(_qss_template(qss_content))
+        for i in range(1, len(parts), 2):
+            token = parts[i]
+            value = values.get(token)
+            if value is None:
+                value = values[token] = cls.get_colour(token)
+            parts[i] = value
+        processed_qss = "".join(parts)
 
         app.setPalette(cls.get_palette())
         app.setStyleSheet(processed_qss)
+        inst = cls()
+        inst._applied_sig = (inst._theme_args, values["font_family"])
 
     @staticmethod
     def _to_qcolor(val: ColourLike) -> QColor:
@@ -91,13 +91,11 @@ def main() -> None:
                 plugin.start()
             except Exception as exc:
                 _log.error("plugin.start() raised: %s", exc)
-            finally:
-                # Plugin finished — exit event loop whether stopped normally
-                # or due to an exception.
-                _log.debug("Worker: plugin thread finished, quitting event loop")
-                QCoreApplication.quit()
 
+    # The bridge quits the event loop (on the main thread) once run() returns,
+    # whether the plugin stopped normally or due to an exception.
     thread = _PluginThread()
+    bridge.set_plugin_thread(thread)
 
     # Give the bridge 250 ms to connect before starting the plugin
     QTimer.singleShot(250, thread.start)
@@ -110,7 +108,11 @@ def main() -> None:
             QCoreApplication.quit()
 
     # ── Qt event loop ──────────────────────────────────────────
-    sys.exit(app.exec())
+    rc = app.exec()
+    # The stop grace timer can quit while start() is still unwinding; give it
+    # a moment so the QThread is not destroyed while running (which aborts).
+    thread.wait(2000)
+    sys.exit(rc)
 
 
 if __name__ == "__main__":
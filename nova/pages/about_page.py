@@ -35,16 +35,9 @@ class AboutPage(QWidget):
         name.setAlignment(Qt.AlignCenter)
         v.addWidget(name)
 
-        # Version
+        # Version — get_value already unwraps SettingItem dicts to the raw value
         try:
-            ver_val = ctx.config.get_value("version")
-            # Handle SettingItem or raw value
-            if hasattr(ver_val, "value"):
-                ver_str = ver_val.value
-            elif isinstance(ver_val, dict) and "value" in ver_val:
-                ver_str = ver_val["value"]
-            else:
-                ver_str = str(ver_val)
+            ver_str = str(ctx.config.get_value("version", "1.0.0"))
         except Exception:
             ver_str = "1.0.0"
 
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
-    QFrame, QHBoxLayout, QLabel, QScrollArea,
+    QFrame, QLabel, QScrollArea,
     QSizePolicy, QVBoxLayout, QWidget,
 )
 
+from nova.ui.components.layout import hbox, vbox
+
 
 class StatCard(QFrame):
     """A stat card with a large value and an uppercase label."""
@@ -50,9 +52,7 @@ class HomePage(QWidget):
 
         container = QWidget()
         container.setObjectName("HomeContainer")
-        root = QVBoxLayout(container)
-        root.setContentsMargins(32, 32, 32, 32)
-        root.setSpacing(24)
+        root = vbox(container, 32, 24)
 
         # ── Greeting ─────────────────────────────────────────
         greeting = QLabel("Welcome to Nova")
@@ -65,9 +65,7 @@ class HomePage(QWidget):
 
         # ── Stat cards ────────────────────────────────────────
         cards_row = QWidget()
-        cards_layout = QHBoxLayout(cards_row)
-        cards_layout.setContentsMargins(0, 0, 0, 0)
-        cards_layout.setSpacing(16)
+        cards_layout = hbox(cards_row, spacing=16)
 
         self._card_loaded = StatCard("Plugins Loaded", "0")
         self._card_active = StatCard("Plugins Active", "0")
@@ -91,8 +89,7 @@ class HomePage(QWidget):
         root.addStretch()
 
         scroll.setWidget(container)
-        outer = QVBoxLayout(self)
-        outer.setContentsMargins(0, 0, 0, 0)
+        outer = vbox(self)
         outer.addWidget(scroll)
 
     def update_stats(self, loaded: int, active: int):
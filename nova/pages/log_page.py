@@ -3,13 +3,15 @@ from __future__ import annotations
 import logging
 from typing import List, Optional, Tuple
 
-from PySide6.QtCore import QObject, Qt, Signal
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
 from PySide6.QtGui import QFont, QTextCursor
 from PySide6.QtWidgets import (
     QComboBox, QFrame, QHBoxLayout, QPushButton,
-    QSizePolicy, QTextEdit, QVBoxLayout, QWidget,
+    QSizePolicy, QTextEdit, QWidget,
 )
 
+from nova.ui.components.layout import page_layout
+
 
 # ── Thread-safe signal bridge ────────────────────────────────────────────────
 
@@ -54,6 +56,13 @@ class LogPage(QWidget):
         # All records ever received — stored for re-filtering
         self._all_records: List[Tuple[int, str, str]] = []
 
+        # Records received since the last flush — rendered together in one insert
+        self._pending: List[Tuple[int, str]] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
         # ── Signal bridge ────────────────────────────────────────────────────
         self._signaller = _LogSignaller()
         self._signaller.new_record.connect(self._on_new_record)
@@ -75,9 +84,7 @@ class LogPage(QWidget):
         self._min_level: int = getattr(logging, saved_level, logging.DEBUG)
 
         # ── Layout ───────────────────────────────────────────────────────────
-        outer = QVBoxLayout(self)
-        outer.setContentsMargins(20, 20, 20, 20)
-        outer.setSpacing(10)
+        outer = page_layout(self, spacing=10)
 
         # Toolbar — no title (page header shows it)
         toolbar = QHBoxLayout()
@@ -129,29 +136,35 @@ class LogPage(QWidget):
 
     def clear(self) -> None:
         self._all_records.clear()
+        self._pending.clear()
         self._view.clear()
 
     # ── Internal ─────────────────────────────────────────────────────────────
 
-    def _render_record(self, levelno: int, formatted: str) -> None:
+    def _record_html(self, levelno: int, formatted: str) -> str:
         _, color = self._LEVELS.get(levelno, ("", "#CCCCCC"))
         safe = (formatted
                 .replace("&", "&amp;")
                 .replace("<", "&lt;")
                 .replace(">", "&gt;"))
-        html = f'<span style="color:{color}; white-space:pre;">{safe}</span>'
+        return f'<span style="color:{color}; white-space:pre;">{safe}</span><br>'
+
+    def _insert_html(self, html: str) -> None:
         cursor = self._view.textCursor()
         cursor.movePosition(QTextCursor.End)
         self._view.setTextCursor(cursor)
-        self._view.insertHtml(html + "<br>")
+        self._view.insertHtml(html)
 
     def _rerender(self) -> None:
         """Rebuild the view from _all_records using the current filter level."""
         was_auto = self._auto_scroll
+        self._pending.clear()
         self._view.clear()
-        for levelno, _levelname, formatted in self._all_records:
-            if levelno >= self._min_level:
-                self._render_record(levelno, formatted)
+        self._insert_html("".join([
+            self._record_html(levelno, formatted)
+            for levelno, _levelname, formatted in self._all_records
+            if levelno >= self._min_level
+        ]))
         if was_auto:
             sb = self._view.verticalScrollBar()
             sb.setValue(sb.maximum())
@@ -161,7 +174,18 @@ class LogPage(QWidget):
         self._all_records.append((levelno, levelname, formatted))
         if levelno < self._min_level:
             return
-        self._render_record(levelno, formatted)
+        self._pending.append((levelno, formatted))
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_pending(self) -> None:
+        """Render every queued record with a single document insert and scroll."""
+        if not self._pending:
+            return
+        html = "".join([self._record_html(levelno, formatted)
+                        for levelno, formatted in self._pending])
+        self._pending.clear()
+        self._insert_html(html)
         if self._auto_scroll:
             self._view.verticalScrollBar().setValue(
                 self._view.verticalScrollBar().maximum()
@@ -178,6 +202,7 @@ class LogPage(QWidget):
 
     def _on_clear(self) -> None:
         self._all_records.clear()
+        self._pending.clear()
         self._view.clear()
 
     def _on_scroll_changed(self, value: int) -> None:
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import logging
+from functools import partial
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QSize, Qt, Signal
+from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QDialog, QDialogButtonBox, QFileDialog, QFormLayout,
     QFrame, QGridLayout, QHBoxLayout, QLabel, QLineEdit,
@@ -12,10 +14,11 @@ from PySide6.QtWidgets import (
     QVBoxLayout, QWidget,
 )
 
+from nova.ui.components.layout import page_layout, vbox
+
 _log = logging.getLogger(__name__)
 
-_COLOR_RUNNING = "#22C55E"
-_COLOR_CRASHED = "#EF4444"
+_CARD_COLUMNS = 2  # plugin cards per grid row
 
 
 def _fg1_color() -> str:
@@ -42,6 +45,15 @@ def _accent_color() -> str:
         return "#0088CC"
 
 
+def _status_color(status: str) -> str:
+    """Colour for a plugin status; the same <status_*> token nova.qss uses."""
+    try:
+        from nova.core.style import StyleManager
+        return StyleManager.get_colour(f"status_{status}")
+    except Exception:
+        return "#888888"
+
+
 def _render_plugin_icon(icon_str: str, color: str, size: int = 32):
     try:
         from nova.core.icons import IconManager
@@ -52,6 +64,26 @@ def _render_plugin_icon(icon_str: str, color: str, size: int = 32):
         return None
 
 
+# Every card shows the same action icons, so render each (name, colour, size) once
+_ICON_CACHE: Dict[Tuple[str, str, int], QIcon] = {}
+_ICON_CACHE_MAX = 64
+
+
+def _cached_icon(icon_name: str, color: str, size: int) -> Optional[QIcon]:
+    key = (icon_name, color, size)
+    icon = _ICON_CACHE.get(key)
+    if icon is None:
+        from nova.core.icons import IconManager
+        px = IconManager.get_pixmap(icon_name, color, size)
+        if not px or px.isNull():
+            return None
+        if len(_ICON_CACHE) >= _ICON_CACHE_MAX:
+            _ICON_CACHE.clear()  # stale theme colours; cheap to rebuild
+        icon = QIcon(px)
+        _ICON_CACHE[key] = icon
+    return icon
+
+
 def _make_icon_btn(icon_name: str, tooltip: str, size: int = 26,
                    parent: QWidget | None = None) -> QPushButton:
     """Create a small icon-only QPushButton. Returns (btn, icon_name, size) for refreshing."""
@@ -71,13 +103,12 @@ def _set_icon_btn_pixmap(btn: QPushButton, icon_name: str, size: int) -> None:
         "action_backup": "⤓", "action_info": "ℹ",
     }
     try:
-        from nova.core.icons import IconManager
         from nova.core.style import StyleManager
         color = StyleManager.get_colour("fg1")
-        px = IconManager.get_pixmap(icon_name, color, size - 6)
-        if px and not px.isNull():
-            btn.setIcon(px)
-            btn.setIconSize(px.size())
+        icon = _cached_icon(icon_name, color, size - 6)
+        if icon is not None:
+            btn.setIcon(icon)
+            btn.setIconSize(QSize(size - 6, size - 6))
             btn.setText("")
             return
     except Exception:
@@ -85,6 +116,15 @@ def _set_icon_btn_pixmap(btn: QPushButton, icon_name: str, size: int) -> None:
     btn.setText(_FALLBACKS.get(icon_name, "?"))
 
 
+def _wrapped_label(text: str, object_name: str = "") -> QLabel:
+    """Create a word-wrapping QLabel, optionally tagged for QSS."""
+    lbl = QLabel(text)
+    lbl.setWordWrap(True)
+    if object_name:
+        lbl.setObjectName(object_name)
+    return lbl
+
+
 class _NewPluginDialog(QDialog):
     def __init__(self, parent: QWidget | None = None):
         super().__init__(parent)
@@ -134,18 +174,19 @@ class _InfoDialog(QDialog):
         self.setMinimumWidth(420)
         layout = QVBoxLayout(self)
         layout.setSpacing(8)
+        # One form layout for every row instead of a nested QHBoxLayout each
+        form = QFormLayout()
+        form.setSpacing(8)
+        form.setRowWrapPolicy(QFormLayout.DontWrapRows)
+        layout.addLayout(form)
 
         def row(label, value):
-            h = QHBoxLayout()
-            lbl = QLabel(f"<b>{label}</b>"); lbl.setFixedWidth(130)
-            val = QLabel(str(value)); val.setWordWrap(True)
-            h.addWidget(lbl); h.addWidget(val, 1)
-            layout.addLayout(h)
+            form.addRow(f"<b>{label}</b>", _wrapped_label(str(value)))
 
         row("ID", manifest.id); row("Name", manifest.name)
         row("Version", manifest.version); row("Author", manifest.author)
         row("Description", manifest.description)
-        sep = QFrame(); sep.setFrameShape(QFrame.HLine); layout.addWidget(sep)
+        sep = QFrame(); sep.setFrameShape(QFrame.HLine); form.addRow(sep)
         row("Enabled", "Yes" if state.enabled else "No")
         row("Favorite", "Yes" if state.favorite else "No")
         row("Run count", str(state.run_count))
@@ -188,7 +229,7 @@ class PluginCard(QFrame):
         self._icon_lbl = QLabel()
         self._icon_lbl.setFixedSize(32, 32)
         self._icon_lbl.setAlignment(Qt.AlignCenter)
-        self._icon_lbl.setStyleSheet("background: transparent;")
+        self._icon_lbl.setObjectName("PluginCardIcon")
 
         name_lbl = QLabel(manifest.name)
         name_lbl.setObjectName("PluginCardName")
@@ -212,9 +253,8 @@ class PluginCard(QFrame):
         v.addLayout(header)
 
         # ── Description ───────────────────────────────────────
-        desc = QLabel(manifest.description or "No description provided.")
-        desc.setObjectName("PluginCardDesc")
-        desc.setWordWrap(True)
+        desc = _wrapped_label(manifest.description or "No description provided.",
+                              "PluginCardDesc")
         v.addWidget(desc)
 
         if manifest.author:
@@ -229,19 +269,19 @@ class PluginCard(QFrame):
         self._start_btn = QPushButton("Start")
         self._start_btn.setObjectName("PluginStartButton")
         self._start_btn.setFixedWidth(64)
-        self._start_btn.clicked.connect(lambda: self.start_clicked.emit(manifest.id))
+        self._start_btn.clicked.connect(partial(self._emit_action, self.start_clicked))
 
         self._stop_btn = QPushButton("Stop")
         self._stop_btn.setObjectName("PluginStopButton")
         self._stop_btn.setFixedWidth(64)
         self._stop_btn.setEnabled(False)
-        self._stop_btn.clicked.connect(lambda: self.stop_clicked.emit(manifest.id))
+        self._stop_btn.clicked.connect(partial(self._emit_action, self.stop_clicked))
 
         self._view_btn = QPushButton("View")
         self._view_btn.setObjectName("PluginViewButton")
         self._view_btn.setFixedWidth(64)
         self._view_btn.setEnabled(False)
-        self._view_btn.clicked.connect(lambda: self.view_clicked.emit(manifest.id))
+        self._view_btn.clicked.connect(partial(self._emit_action, self.view_clicked))
 
         primary.addWidget(self._start_btn)
         primary.addWidget(self._stop_btn)
@@ -254,17 +294,17 @@ class PluginCard(QFrame):
         secondary.setSpacing(2)
 
         self._reload_btn = _make_icon_btn("action_autorenew", "Reload plugin")
-        self._reload_btn.clicked.connect(lambda: self.reload_clicked.emit(manifest.id))
+        self._reload_btn.clicked.connect(partial(self._emit_action, self.reload_clicked))
 
         self._export_btn = _make_icon_btn("action_backup", "Export as .zip")
-        self._export_btn.clicked.connect(lambda: self.export_clicked.emit(manifest.id))
+        self._export_btn.clicked.connect(partial(self._emit_action, self.export_clicked))
 
         self._delete_btn = _make_icon_btn("action_delete", "Delete plugin")
         self._delete_btn.setObjectName("DeleteButton")
-        self._delete_btn.clicked.connect(lambda: self.delete_clicked.emit(manifest.id))
+        self._delete_btn.clicked.connect(partial(self._emit_action, self.delete_clicked))
 
         self._info_btn = _make_icon_btn("action_info", "Plugin info")
-        self._info_btn.clicked.connect(lambda: self.info_clicked.emit(manifest.id))
+        self._info_btn.clicked.connect(partial(self._emit_action, self.info_clicked))
 
         # Store for refresh
         self._secondary_btns: List[Tuple[QPushButton, str]] = [
@@ -292,7 +332,7 @@ class PluginCard(QFrame):
         self._stop_btn.setEnabled(active)
         self._view_btn.setEnabled(active)
         if active:
-            self._apply_status("Running", _COLOR_RUNNING)
+            self._apply_status("Running", _status_color("running"))
         else:
             self._apply_status("Stopped", _fg2_color())
 
@@ -300,7 +340,7 @@ class PluginCard(QFrame):
         self._start_btn.setEnabled(True)
         self._stop_btn.setEnabled(False)
         self._view_btn.setEnabled(False)
-        self._apply_status("Crashed", _COLOR_CRASHED)
+        self._apply_status("Crashed", _status_color("crashed"))
 
     def set_favorite(self, value: bool):
         self._is_favorite = value
@@ -321,10 +361,16 @@ class PluginCard(QFrame):
         else:
             self._icon_lbl.setText("?")
         self._status_lbl.setText(text)
-        weight = "600" if text != "Stopped" else "400"
-        self._status_lbl.setStyleSheet(
-            f"color: {color}; font-size: 11px; font-weight: {weight}; background: transparent;"
-        )
+        # Colour/weight come from #PluginStatusLabel[status=...] rules in nova.qss
+        status = text.lower()
+        if self._status_lbl.property("status") != status:
+            self._status_lbl.setProperty("status", status)
+            self._status_lbl.style().unpolish(self._status_lbl)
+            self._status_lbl.style().polish(self._status_lbl)
+
+    def _emit_action(self, signal, *_):
+        # Bound method + partial rather than a lambda per button; clicked's checked flag is ignored
+        signal.emit(self._manifest.id)
 
     def _on_favorite_clicked(self):
         self.favorite_toggled.emit(self._manifest.id, not self._is_favorite)
@@ -334,13 +380,12 @@ class PluginCard(QFrame):
         tip = "Remove from sidebar" if self._is_favorite else "Pin to sidebar"
         self._fav_btn.setToolTip(tip)
         try:
-            from nova.core.icons import IconManager
             from nova.core.style import StyleManager
             color = StyleManager.get_colour("accent") if self._is_favorite else StyleManager.get_colour("fg1")
-            px = IconManager.get_pixmap(icon, color, 18)
-            if px and not px.isNull():
-                self._fav_btn.setIcon(px)
-                self._fav_btn.setIconSize(px.size())
+            qicon = _cached_icon(icon, color, 18)
+            if qicon is not None:
+                self._fav_btn.setIcon(qicon)
+                self._fav_btn.setIconSize(QSize(18, 18))
                 self._fav_btn.setText("")
                 return
         except Exception:
@@ -370,9 +415,7 @@ class PluginsPage(QWidget):
 
         self._container = QWidget()
         self._container.setObjectName("PluginsContainer")
-        self._root = QVBoxLayout(self._container)
-        self._root.setContentsMargins(20, 20, 20, 20)
-        self._root.setSpacing(16)
+        self._root = page_layout(self._container)
 
         toolbar = QHBoxLayout()
         toolbar.setSpacing(10)
@@ -397,8 +440,7 @@ class PluginsPage(QWidget):
         self._root.addStretch()
 
         scroll.setWidget(self._container)
-        outer = QVBoxLayout(self)
-        outer.setContentsMargins(0, 0, 0, 0)
+        outer = vbox(self)
         outer.addWidget(scroll)
 
     # ── Public API ────────────────────────────────────────────
@@ -446,7 +488,7 @@ class PluginsPage(QWidget):
         card.delete_clicked.connect(self._on_delete_clicked)
         card.info_clicked.connect(self._on_info_clicked)
         card.set_active(self._pm.is_active(manifest.id))
-        row, col = divmod(idx, 2)
+        row, col = divmod(idx, _CARD_COLUMNS)
         self._grid.addWidget(card, row, col)
         self._cards[manifest.id] = card
 
@@ -484,10 +526,10 @@ class PluginsPage(QWidget):
                 QMessageBox.warning(self, "Delete Failed", err)
 
     def _on_info_clicked(self, pid: str):
-        record = self._pm._records.get(pid)
-        if record is None:
+        manifest = self._pm.get_manifest(pid)
+        if manifest is None:
             return
-        dlg = _InfoDialog(record.manifest, self._pm.get_state(pid), self)
+        dlg = _InfoDialog(manifest, self._pm.get_state(pid), self)
         dlg.exec()
 
     def _on_import_clicked(self):
@@ -11,7 +11,9 @@ from PySide6.QtWidgets import (
 )
 
 from nova.core.config import SettingItem
+from nova.core.style import read_qss
 from nova.ui.components.settings_widgets import BaseSettingWidget, BoolSettingWidget, create_setting_widget
+from nova.ui.components.layout import PAGE_SPACING, page_layout, vbox
 
 _log = logging.getLogger(__name__)
 
@@ -37,16 +39,18 @@ def _apply_font(path: str, app) -> None:
             _log.warning("Failed to apply font '%s': %s", path, exc)
 
 
-def _reapply_style(app, ctx) -> None:
+def _reapply_style(app, ctx, qss_path: Optional[Path]) -> bool:
+    """Rebuild the palette and stylesheet. Returns False if nothing changed or it failed."""
+    qss_text = read_qss(qss_path) if qss_path is not None else None
+    if qss_text is None:
+        return False
     try:
         accent = ctx.config.get_value("appearance.accent", "#0088CC")
         theme  = ctx.config.get_value("appearance.theme",  "dark")
-        ctx.style.initialise(accent, theme=theme)
-        qss_path = Path(__file__).parent.parent.parent / "resources" / "qss" / "nova.qss"
-        if qss_path.exists():
-            ctx.style.apply_theme(app, qss_path.read_text(encoding="utf-8"))
+        return ctx.style.reapply(app, accent, theme, qss_text)
     except Exception as exc:
         _log.warning("Failed to reapply style: %s", exc)
+        return False
 
 
 # ---------------------------------------------------------------------------
@@ -57,11 +61,13 @@ class SettingRow(QWidget):
     def __init__(self, key: str, item: SettingItem, ctx,
                  on_plugins_path_changed: Optional[Callable[[str], None]] = None,
                  on_style_changed: Optional[Callable[[], None]] = None,
+                 qss_path: Optional[Path] = None,
                  parent: QWidget | None = None):
         super().__init__(parent)
         self._key = key
         self._item = item
         self._ctx = ctx
+        self._qss_path = qss_path
         self._on_plugins_path_changed = on_plugins_path_changed
         self._on_style_changed = on_style_changed
         self.setObjectName("SettingRow")
@@ -91,10 +97,8 @@ class SettingRow(QWidget):
                 layout.addWidget(self._widget, 0, Qt.AlignRight | Qt.AlignVCenter)
             else:
                 right = QWidget()
+                # Transparent via the #SettingRowRight rule in nova.qss
                 right.setObjectName("SettingRowRight")
-                # Explicit selector — does NOT cascade to child controls,
-                # so ctrl_bg / ctrl_fg from the app stylesheet reach them.
-                right.setStyleSheet("QWidget#SettingRowRight { background: transparent; }")
                 right.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
                 right_layout = QHBoxLayout(right)
                 right_layout.setContentsMargins(0, 0, 0, 0)
@@ -114,14 +118,13 @@ class SettingRow(QWidget):
         app = QApplication.instance()
 
         if self._key in ("appearance.accent", "appearance.theme"):
-            if app:
-                _reapply_style(app, self._ctx)
-            if self._on_style_changed:
+            changed = _reapply_style(app, self._ctx, self._qss_path) if app else True
+            if changed and self._on_style_changed:
                 self._on_style_changed()
         elif self._key == "appearance.font":
             if app:
                 _apply_font(str(value), app)
-                _reapply_style(app, self._ctx)
+                _reapply_style(app, self._ctx, self._qss_path)
         elif self._key == "system.plugins_path":
             if self._on_plugins_path_changed is not None:
                 self._on_plugins_path_changed(str(value))
@@ -158,10 +161,12 @@ class SettingsPage(QWidget):
     plugins_path_changed = Signal(str)
     style_changed = Signal()
 
-    def __init__(self, ctx, plugin_manager, parent: QWidget | None = None):
+    def __init__(self, ctx, plugin_manager, qss_path: Optional[Path] = None,
+                 parent: QWidget | None = None):
         super().__init__(parent)
         self._ctx = ctx
         self._pm = plugin_manager
+        self._qss_path = qss_path  # stylesheet re-applied when appearance settings change
         self.setObjectName("SettingsPage")
 
         scroll = QScrollArea(self)
@@ -170,16 +175,12 @@ class SettingsPage(QWidget):
 
         container = QWidget()
         container.setObjectName("SettingsContainer")
-        self._root = QVBoxLayout(container)
-        self._root.setContentsMargins(20, 20, 20, 20)
-        self._root.setSpacing(16)
+        self._root = page_layout(container)
 
         self._build_app_settings()
 
         self._plugin_container = QWidget()
-        self._plugin_layout = QVBoxLayout(self._plugin_container)
-        self._plugin_layout.setContentsMargins(0, 0, 0, 0)
-        self._plugin_layout.setSpacing(16)
+        self._plugin_layout = vbox(self._plugin_container, spacing=PAGE_SPACING)
         self._root.addWidget(self._plugin_container)
 
         if self._pm:
@@ -189,8 +190,7 @@ class SettingsPage(QWidget):
 
         self._root.addStretch()
         scroll.setWidget(container)
-        outer = QVBoxLayout(self)
-        outer.setContentsMargins(0, 0, 0, 0)
+        outer = vbox(self)
         outer.addWidget(scroll)
 
     # ── Public API ────────────────────────────────────────────
@@ -226,9 +226,7 @@ class SettingsPage(QWidget):
         """Return a section widget: small title label above a card frame."""
         wrapper = QWidget()
         wrapper.setObjectName("SettingSectionWrapper")
-        v = QVBoxLayout(wrapper)
-        v.setContentsMargins(0, 0, 0, 0)
-        v.setSpacing(4)
+        v = vbox(wrapper, spacing=4)
 
         # Section title — sits ABOVE the card
         title_lbl = QLabel(title.upper())
@@ -238,9 +236,7 @@ class SettingsPage(QWidget):
         card = QFrame()
         card.setObjectName("SettingCard")
         card.setFrameShape(QFrame.NoFrame)
-        card_v = QVBoxLayout(card)
-        card_v.setContentsMargins(0, 0, 0, 0)
-        card_v.setSpacing(0)
+        card_v = vbox(card)
 
         for idx, (key, item) in enumerate(rows):
             if idx > 0:
@@ -250,7 +246,8 @@ class SettingsPage(QWidget):
                 card_v.addWidget(sep)
             row = SettingRow(key, item, self._ctx,
                              on_plugins_path_changed=self._on_plugins_path_changed,
-                             on_style_changed=self._emit_style_changed)
+                             on_style_changed=self._emit_style_changed,
+                             qss_path=self._qss_path)
             card_v.addWidget(row)
 
         v.addWidget(title_lbl)
@@ -273,7 +270,7 @@ class SettingsPage(QWidget):
         if not self._pm:
             return
         for manifest in self._pm.manifests():
-            record = self._pm._records.get(manifest.id)
+            record = self._pm.get_record(manifest.id)
             if not record or not record.plugin:
                 continue
             try:
@@ -0,0 +1,38 @@
+"""
+Layout presets shared by Nova pages.
+
+Pages use a handful of fixed margin/spacing combinations; these helpers
+build the box layout with them in one call.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from PySide6.QtWidgets import QHBoxLayout, QVBoxLayout, QWidget
+
+PAGE_MARGIN  = 20  # outer margin of scrollable page containers
+PAGE_SPACING = 16  # gap between sections on a page
+
+
+def vbox(parent: Optional[QWidget] = None, margin: int = 0,
+         spacing: int = 0) -> QVBoxLayout:
+    """QVBoxLayout with uniform *margin* and *spacing*."""
+    layout = QVBoxLayout(parent)
+    layout.setContentsMargins(margin, margin, margin, margin)
+    layout.setSpacing(spacing)
+    return layout
+
+
+def hbox(parent: Optional[QWidget] = None, margin: int = 0,
+         spacing: int = 0) -> QHBoxLayout:
+    """QHBoxLayout with uniform *margin* and *spacing*."""
+    layout = QHBoxLayout(parent)
+    layout.setContentsMargins(margin, margin, margin, margin)
+    layout.setSpacing(spacing)
+    return layout
+
+
+def page_layout(container: QWidget, spacing: int = PAGE_SPACING) -> QVBoxLayout:
+    """Root column for a page container, using the standard page margin."""
+    return vbox(container, PAGE_MARGIN, spacing)
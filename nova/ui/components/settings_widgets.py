@@ -23,7 +23,7 @@ from __future__ import annotations
 
 from typing import List, Optional, Any
 
-from PySide6.QtCore import QSize, Signal
+from PySide6.QtCore import QSize, QTimer, Signal
 from PySide6.QtGui import QColor, QIcon
 from PySide6.QtWidgets import (
     QCheckBox, QColorDialog, QComboBox, QFileDialog,
@@ -33,6 +33,12 @@ from PySide6.QtWidgets import (
 
 _MIN_INPUT_WIDTH = 260  # minimum width for text/path inputs
 _COMBO_WIDTH     = 260  # fixed width for combo boxes (finite option list)
+_SPIN_DEBOUNCE_MS = 300  # quiet period before a spin-box change is committed
+
+
+def _as_bool(value: Any) -> bool:
+    """Config booleans may be stored as "true"/"false" strings."""
+    return value.lower() == "true" if isinstance(value, str) else bool(value)
 
 
 class BaseSettingWidget(QWidget):
@@ -140,24 +146,29 @@ class BoolSettingWidget(BaseSettingWidget):
         layout.setContentsMargins(0, 0, 0, 0)
 
         self._chk = QCheckBox()
-        checked = (str(value).lower() == "true") if isinstance(value, str) else bool(value)
-        self._chk.setChecked(checked)
-        self._chk.stateChanged.connect(lambda s: self.value_changed.emit(s == 2))
+        self._chk.setChecked(_as_bool(value))
+        self._chk.toggled.connect(self.value_changed)
         layout.addWidget(self._chk)
 
     def get_value(self) -> bool:
         return self._chk.isChecked()
 
     def set_value(self, val: Any) -> None:
-        checked = (str(val).lower() == "true") if isinstance(val, str) else bool(val)
-        self._chk.setChecked(checked)
+        self._chk.setChecked(_as_bool(val))
 
 
 class ColorSettingWidget(BaseSettingWidget):
     """Colour-swatch button + QColorDialog."""
 
+    _STYLE_TEMPLATE = (
+        "background-color: {bg}; color: {fg}; "
+        "border: none; border-radius: 10px; font-weight: 600; "
+        "min-height: 26px; max-height: 26px;"
+    )
+
     def __init__(self, value: str = "#000000", parent: QWidget | None = None):
         super().__init__(parent)
+        self._last_style = ""
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
@@ -187,11 +198,10 @@ class ColorSettingWidget(BaseSettingWidget):
         lum = (0.299 * c.red() + 0.587 * c.green() + 0.114 * c.blue()) / 255
         text_color = "#000000" if lum > 0.5 else "#FFFFFF"
         self._btn.setText(hex_val.upper())
-        self._btn.setStyleSheet(
-            f"background-color: {hex_val}; color: {text_color}; "
-            "border: none; border-radius: 10px; font-weight: 600; "
-            "min-height: 26px; max-height: 26px;"
-        )
+        style = self._STYLE_TEMPLATE.format(bg=hex_val, fg=text_color)
+        if style != self._last_style:  # setStyleSheet re-parses and re-polishes
+            self._last_style = style
+            self._btn.setStyleSheet(style)
 
     def get_value(self) -> str:
         return self._current
@@ -286,9 +296,25 @@ class SpinboxSettingWidget(BaseSettingWidget):
             self._spin.setValue(int(value))
         except (ValueError, TypeError):
             self._spin.setValue(0)
-        self._spin.valueChanged.connect(lambda v: self.value_changed.emit(v))
+        self._emitted = self._spin.value()
+
+        # Each emit saves the config to disk, so coalesce arrow-key / typing
+        # bursts and commit once the value settles or focus leaves.
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(_SPIN_DEBOUNCE_MS)
+        self._debounce.timeout.connect(self._commit)
+        self._spin.valueChanged.connect(lambda _v: self._debounce.start())
+        self._spin.editingFinished.connect(self._commit)
         layout.addWidget(self._spin)
 
+    def _commit(self) -> None:
+        self._debounce.stop()
+        v = self._spin.value()
+        if v != self._emitted:
+            self._emitted = v
+            self.value_changed.emit(v)
+
     def get_value(self) -> int:
         return self._spin.value()
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, Optional, Set, Tuple
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
@@ -47,6 +47,8 @@ class MainWindow(QMainWindow):
         self._ctx = ctx
         self._pm = plugin_manager
         self._pages: Dict[str, Tuple[str, QWidget]] = {}
+        self._page_builders: Dict[str, Callable[[], QWidget]] = {}
+        self._plugin_page_ids: Set[str] = set()  # subset of _pages added via add_plugin_page
         self._current: Optional[str] = None
 
         self.setWindowTitle("Nova")
@@ -90,19 +92,38 @@ class MainWindow(QMainWindow):
         self._stack.addWidget(widget)
         self._sidebar.add_item(page_id, title, icon)
 
+    def add_lazy_page(self, page_id: str, title: str, icon: str,
+                      builder: Callable[[], QWidget]):
+        """Register a page whose widget is only built the first time it is navigated to."""
+        if page_id in self._pages:
+            return
+        placeholder = QWidget()
+        self._pages[page_id] = (title, placeholder)
+        self._page_builders[page_id] = builder
+        self._stack.addWidget(placeholder)
+        self._sidebar.add_item(page_id, title, icon)
+
     def add_plugin_page(self, page_id: str, title: str, icon: str,
                         widget: QWidget, in_sidebar: bool = True):
         if page_id in self._pages:
             return
         self._pages[page_id] = (title, widget)
+        self._plugin_page_ids.add(page_id)
         self._stack.addWidget(widget)
         if in_sidebar:
             self._sidebar.add_plugin_item(page_id, title, icon)
 
+    def has_plugin_page(self, page_id: str) -> bool:
+        return page_id in self._plugin_page_ids
+
+    def plugin_page_ids(self) -> Tuple[str, ...]:
+        return tuple(self._plugin_page_ids)
+
     def remove_plugin_page(self, page_id: str):
         entry = self._pages.pop(page_id, None)
         if entry is None:
             return
+        self._plugin_page_ids.discard(page_id)
         _title, widget = entry
         if self._current == page_id:
             self.navigate("home")
@@ -113,6 +134,8 @@ class MainWindow(QMainWindow):
     def show_plugin_in_sidebar(self, page_id: str, title: str, icon: str):
         if page_id in self._pages:
             self._sidebar.add_plugin_item(page_id, title, icon)
+            if page_id == self._current:
+                self._sidebar.set_active(page_id)
 
     def hide_plugin_from_sidebar(self, page_id: str):
         self._sidebar.remove_item(page_id)
@@ -121,11 +144,26 @@ class MainWindow(QMainWindow):
         self._sidebar.add_separator()
 
     def navigate(self, page_id: str):
+        if page_id == self._current:
+            return
         entry = self._pages.get(page_id)
         if entry is None:
             return
         title, widget = entry
+        builder = self._page_builders.pop(page_id, None)
+        if builder is not None:
+            widget = self._build_lazy_page(page_id, title, widget, builder)
         self._stack.setCurrentWidget(widget)
         self._header.set_title(title)
         self._sidebar.set_active(page_id)
         self._current = page_id
+
+    def _build_lazy_page(self, page_id: str, title: str, placeholder: QWidget,
+                         builder: Callable[[], QWidget]) -> QWidget:
+        widget = builder()
+        index = self._stack.indexOf(placeholder)
+        self._stack.insertWidget(index, widget)
+        self._stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self._pages[page_id] = (title, widget)
+        return widget
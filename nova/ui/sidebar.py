@@ -56,6 +56,9 @@ class SidebarItem(QWidget):
         self._label_text = label
         self._icon_name = icon_name
         self._active = False
+        # Rendered icons by colour; navigation only flips between two tints
+        self._pixmaps: Dict[str, QPixmap] = {}
+        self._icon_color: Optional[str] = None
 
         self.setObjectName("SidebarItem")
         self.setFixedHeight(40)
@@ -101,8 +104,10 @@ class SidebarItem(QWidget):
             return
         self._active = active
         self.setProperty("active", active)
-        self.style().unpolish(self)
-        self.style().polish(self)
+        # Text/icon colours come from #SidebarItem[active] rules in nova.qss
+        for w in (self, self._icon, self._text):
+            w.style().unpolish(w)
+            w.style().polish(w)
         if active:
             self._apply_active_style()
         else:
@@ -123,40 +128,40 @@ class SidebarItem(QWidget):
     #  Internal
     # ──────────────────────────────────────────────────────
 
-    def _set_icon_pixmap(self, color: str):
-        """Set the icon QLabel pixmap with the requested colour."""
+    def _render_icon(self, color: str) -> Optional[QPixmap]:
+        px = self._pixmaps.get(color)
+        if px is not None:
+            return px
         clean_name = self._icon_name.strip()
         if clean_name.startswith("<") and "svg" in clean_name:
             try:
                 from nova.core.icons import IconManager
                 px = IconManager.render_svg_string(clean_name, color, 20)
-                if px and not px.isNull():
-                    self._icon.setPixmap(px)
-                    self._icon.setStyleSheet("background: transparent;")
-                    return
             except Exception:
-                pass
+                px = None
+        if px is None or px.isNull():
+            px = _get_icon_pixmap(self._icon_name, color)
+        if px is not None and not px.isNull():
+            self._pixmaps[color] = px
+        return px
 
-        px = _get_icon_pixmap(self._icon_name, color)
+    def _set_icon_pixmap(self, color: str):
+        """Set the icon QLabel pixmap with the requested colour."""
+        if color == self._icon_color:
+            return
+        self._icon_color = color
+        px = self._render_icon(color)
         if px is not None and not px.isNull():
             self._icon.setPixmap(px)
-            self._icon.setStyleSheet("background: transparent;")
         else:
             short = self._icon_name if len(self._icon_name) < 20 else "?"
             self._icon.setText(short)
-            self._icon.setStyleSheet(f"color: {color}; background: transparent;")
 
     def _apply_active_style(self):
-        ac = _accent_color()
-        self._set_icon_pixmap(ac)
-        self._text.setStyleSheet(
-            f"color: {ac}; font-weight: 600; background: transparent;"
-        )
+        self._set_icon_pixmap(_accent_color())
 
     def _apply_inactive_style(self):
-        fg = _fg1_color()
-        self._set_icon_pixmap(fg)
-        self._text.setStyleSheet(f"color: {fg}; background: transparent;")
+        self._set_icon_pixmap(_fg1_color())
 
     def mousePressEvent(self, event):
         super().mousePressEvent(event)
@@ -195,6 +200,8 @@ class Sidebar(QFrame):
         self._expanded = True
         self._items: Dict[str, SidebarItem] = {}
         self._separator: Optional[SidebarSeparator] = None
+        self._hamburger_color: Optional[str] = None
+        self._active_id: Optional[str] = None
 
         self.setMinimumWidth(EXPANDED)
         self.setMaximumWidth(EXPANDED)
@@ -305,8 +312,14 @@ class Sidebar(QFrame):
             self._separator = sep
 
     def set_active(self, item_id: str):
-        for sid, item in self._items.items():
-            item.set_active(sid == item_id)
+        # Only the outgoing and incoming rows change state
+        previous = self._items.get(self._active_id)
+        if previous is not None and self._active_id != item_id:
+            previous.set_active(False)
+        current = self._items.get(item_id)
+        if current is not None:
+            current.set_active(True)
+        self._active_id = item_id
 
     def refresh_colors(self):
         """Re-render all item icons/text with up-to-date theme colours.
@@ -326,7 +339,11 @@ class Sidebar(QFrame):
     # ──────────────────────────────────────────────────────
 
     def _set_hamburger_icon(self):
-        px = _get_icon_pixmap("menu", _fg1_color(), 22)
+        color = _fg1_color()
+        if color == self._hamburger_color:
+            return
+        self._hamburger_color = color
+        px = _get_icon_pixmap("menu", color, 22)
         if px is not None and not px.isNull():
             self._hamburger.setIcon(px)
             self._hamburger.setIconSize(px.size())
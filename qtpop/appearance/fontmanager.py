@@ -12,6 +12,7 @@ class FontManager:
         self._family_cycle = None
         self._loaded_families = []  # List of loaded font families
         self._font_map = {}  # Maps tags like 'h1' to font info
+        self._path_families = {}  # font_path -> family, so a file is registered once
 
     def _init(self):
         self._family_cycle = None     # Iterator for round-robin font assignment
@@ -22,20 +23,23 @@ class FontManager:
         Loads a TTF font and optionally maps it to a tag with a size.
         If tag/size is not provided, font is added to the pool for round-robin mapping.
         """
-        if not os.path.exists(font_path):
-            raise FileNotFoundError(f"Font file not found: {font_path}")
+        family = self._path_families.get(font_path)
+        if family is None:
+            if not os.path.exists(font_path):
+                raise FileNotFoundError(f"Font file not found: {font_path}")
 
-        font_id = QFontDatabase.addApplicationFont(font_path)
-        if font_id == -1:
-            raise RuntimeError(f"Failed to load font: {font_path}")
+            font_id = QFontDatabase.addApplicationFont(font_path)
+            if font_id == -1:
+                raise RuntimeError(f"Failed to load font: {font_path}")
 
-        families = QFontDatabase.applicationFontFamilies(font_id)
-        if not families:
-            raise RuntimeError(f"No font families found in: {font_path}")
+            families = QFontDatabase.applicationFontFamilies(font_id)
+            if not families:
+                raise RuntimeError(f"No font families found in: {font_path}")
 
-        family = families[0]
-        self._loaded_families.append(family)
-        self._family_cycle = cycle(self._loaded_families)
+            family = families[0]
+            self._path_families[font_path] = family
+            self._loaded_families.append(family)
+            self._family_cycle = cycle(self._loaded_families)
 
         if tag:
             self._font_map[tag] = {
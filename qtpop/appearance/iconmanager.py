@@ -54,6 +54,8 @@ class IconManager:
     _icon_lock = threading.Lock()
     _images_path: str = r"resources/images/"
     _icon_list: List[str] = []
+    _resolved_names: Dict[str, str] = {}  # Query -> resolved icon name
+    _core_names: Dict[str, str] = {}      # Icon name -> lower-cased name without style/size suffixes
     _thread_pool = QThreadPool.globalInstance()
     _notifier = _IconNotifier()  # Holds the actual Qt signal object
 
@@ -80,7 +82,7 @@ class IconManager:
             return sorted(icons)
 
         exact_matches, exact_core_matches, core_matches, substring_matches = [], [], [], []
-        all_suffixes = IconManager._style_suffixes + IconManager._size_suffixes
+        core_names = IconManager._core_names
 
         for icon in icons:
             icon_lower = icon.lower()
@@ -88,16 +90,9 @@ class IconManager:
                 exact_matches.append(icon)
                 continue
 
-            # Iteratively strip all known suffixes to find the true core name
-            core_name = icon_lower
-            stripped = True
-            while stripped:
-                stripped = False
-                for suffix in all_suffixes:
-                    if core_name.endswith(suffix):
-                        core_name = core_name[: -len(suffix)]
-                        stripped = True
-                        break  # Restart the inner loop to handle multiple suffixes
+            core_name = core_names.get(icon)
+            if core_name is None:
+                core_name = core_names[icon] = IconManager._strip_suffixes(icon_lower)
 
             if query_lower == core_name:
                 exact_core_matches.append(icon)
@@ -122,18 +117,7 @@ class IconManager:
         Returns a colored QPixmap of an icon.
         If async_load=True, loads in background and emits `icon_loaded(name, image)` when done.
         """
-        if not cls._icon_list:
-            cls.list_icons()
-
-        # Find the full icon name if a partial name is given
-        name_list = cls.search_icons(name, cls._icon_list)
-        if name_list:
-            resolved_name = name_list[0]
-        elif name in cls._icon_list:
-            resolved_name = name
-        else:
-            raise FileNotFoundError(f"[IconManager] Icon not found: {name}")
-
+        resolved_name = cls._resolve_name(name)
         cache_key = f"{resolved_name}|{color.lower()}|{size}"
 
         # --- Cache lookup (now checking for QImage) ---
@@ -175,21 +159,30 @@ class IconManager:
         """Lists all SVG icons in the configured image path."""
         if not os.path.isdir(cls._images_path):
             cls._icon_list.clear()
+            cls._resolved_names.clear()
             return []
         cls._icon_list = [
             os.path.splitext(f)[0]
             for f in os.listdir(cls._images_path)
             if f.lower().endswith(".svg")
         ]
+        cls._resolved_names.clear()
+        # Strip suffixes once per icon here rather than on every search
+        cls._core_names = {icon: cls._strip_suffixes(icon.lower()) for icon in cls._icon_list}
         return cls._icon_list
 
     @classmethod
     @debug_log
     def set_images_path(cls, path: str):
-        """Sets the path where SVG icons are stored and clears caches."""
+        """Sets the path where SVG icons are stored and clears caches.
+
+        The directory is indexed lazily by the first lookup (or an explicit
+        list_icons() call), so startup does not pay for scanning it.
+        """
         cls._images_path = path
         cls.clear_cache()
-        cls.list_icons()
+        cls._icon_list = []
+        cls._resolved_names.clear()
 
     @classmethod
     @debug_log
@@ -207,6 +200,43 @@ class IconManager:
     # Internal widgets
     # --------------------------
 
+    @classmethod
+    def _strip_suffixes(cls, icon_lower: str) -> str:
+        """Iteratively strip all known style/size suffixes to find the true core name."""
+        all_suffixes = cls._style_suffixes + cls._size_suffixes
+        core_name = icon_lower
+        stripped = True
+        while stripped:
+            stripped = False
+            for suffix in all_suffixes:
+                if core_name.endswith(suffix):
+                    core_name = core_name[: -len(suffix)]
+                    stripped = True
+                    break  # Restart the inner loop to handle multiple suffixes
+        return core_name
+
+    @classmethod
+    def _resolve_name(cls, name: str) -> str:
+        """Map a (partial) icon name to a file name, memoized until the icon list changes."""
+        resolved_name = cls._resolved_names.get(name)
+        if resolved_name is not None:
+            return resolved_name
+
+        if not cls._icon_list:
+            cls.list_icons()
+
+        # Find the full icon name if a partial name is given
+        name_list = cls.search_icons(name, cls._icon_list)
+        if name_list:
+            resolved_name = name_list[0]
+        elif name in cls._icon_list:
+            resolved_name = name
+        else:
+            raise FileNotFoundError(f"[IconManager] Icon not found: {name}")
+
+        cls._resolved_names[name] = resolved_name
+        return resolved_name
+
     @classmethod
     def _cache_result(cls, name: str, color: str, size: int, image: QImage):
         """Safely cache the QImage and emit the signal."""
@@ -274,18 +304,7 @@ class IconManager:
         If async_load=True, this returns None immediately and will emit
         _notifier.icon_loaded(name, svg_text) when ready.
         """
-        if not cls._icon_list:
-            cls.list_icons()
-
-        # Resolve name similar to get_pixmap
-        name_list = cls.search_icons(name, cls._icon_list)
-        if name_list:
-            resolved_name = name_list[0]
-        elif name in cls._icon_list:
-            resolved_name = name
-        else:
-            raise FileNotFoundError(f"[IconManager] Icon not found: {name}")
-
+        resolved_name = cls._resolve_name(name)
         cache_key = f"{resolved_name}|{color.lower()}|{size}"
 
         # Check SVG cache
@@ -27,6 +27,12 @@ class QSSManager:
     _image_token_re = re.compile(r"<img:\s*(.+?);\s*color:(.+?)>", flags=re.IGNORECASE)
     _colour_token_re = re.compile(r"<\s*([a-zA-Z0-9_]+)\s*>")
     _style_sheet: str = ""
+    # Processed output for token-only stylesheets, valid for one StyleManager version
+    _processed_cache: dict = {}
+    # (cwd, resolved temp dir) so <img:> tokens don't mkdir/resolve the same folder per icon
+    _temp_dir: tuple[Path, Path] | None = None
+    _cache_version: int = -1
+    _CACHE_SIZE: int = 16
 
     @classmethod
     def __init__(cls, icon_manager: IconManager, style_manager: StyleManager, logger: QtPopLogger):
@@ -38,6 +44,16 @@ class QSSManager:
     @classmethod
     @debug_log
     def process(cls, raw_qss: str) -> str:
+        version = cls._styler.version()
+        if version != cls._cache_version:
+            cls._processed_cache = {}
+            cls._cache_version = version
+        cached = cls._processed_cache.get(raw_qss)
+        if cached is not None:
+            return cached
+        # Image tokens point at temp SVGs that are deleted shortly after, so never cache those
+        cacheable = cls._image_token_re.search(raw_qss) is None
+
         # First replace image tokens
         def image_replacer(m):
             inner = m.group(1).strip()
@@ -122,6 +138,11 @@ class QSSManager:
                 return "#000000"
 
         processed = cls._colour_token_re.sub(colour_replacer, intermediate)
+        # Skip caching if the colours were re-initialised while expanding
+        if cacheable and cls._styler.version() == version:
+            if len(cls._processed_cache) >= cls._CACHE_SIZE:
+                cls._processed_cache.pop(next(iter(cls._processed_cache)), None)
+            cls._processed_cache[raw_qss] = processed
         return processed
 
     @classmethod
@@ -182,9 +203,13 @@ class QSSManager:
         Returns:
             str: A Qt-compatible URL string, e.g. url('C:/path/file.svg')
         """
-        # Create a stable temp directory within the project
-        temp_dir = Path.cwd() / "tmp_qss_icons"
-        temp_dir.mkdir(exist_ok=True)
+        # Create a stable temp directory within the project, resolved once per working directory
+        cwd = Path.cwd()
+        if cls._temp_dir is None or cls._temp_dir[0] != cwd:
+            temp_dir = cwd / "tmp_qss_icons"
+            temp_dir.mkdir(exist_ok=True)
+            cls._temp_dir = (cwd, temp_dir.resolve())
+        temp_dir = cls._temp_dir[1]
 
         # Generate a unique filename
         temp_file = temp_dir / f"icon_{uuid.uuid4().hex}.svg"
@@ -193,8 +218,8 @@ class QSSManager:
         with open(temp_file, "w", encoding="utf-8") as f:
             f.write(svg_content)
 
-        # Convert to Qt-compatible path (forward slashes)
-        qt_path = temp_file.resolve().as_posix()
+        # Convert to Qt-compatible path (forward slashes); the directory is already resolved
+        qt_path = temp_file.as_posix()
 
         # Schedule deletion in the background after delay
         # (so Qt has time to read the file)
@@ -33,6 +33,7 @@ class StyleManager:
     _colours: Dict[str, QColor] = {}
     _palette: Optional[QPalette] = None
     _resolved_mode: str = "light"  # "light" | "dark"
+    _version: int = 0  # bumped by every initialise(); lets callers key caches on the colour table
 
     # ---- Public API ----------------------------------------------------------
     @classmethod
@@ -120,6 +121,9 @@ class StyleManager:
             cls._colours = colours
             cls._palette = cls._build_palette(colours)
             cls._initialised = True
+            # Bump only once the new table is in place, so a version never
+            # pairs with the colours it replaced.
+            cls._version += 1
             return True
 
         except Exception as ex:
@@ -128,6 +132,7 @@ class StyleManager:
             cls._colours = {}
             cls._palette = None
             cls._resolved_mode = "light"
+            cls._version += 1
             return False
 
     @classmethod
@@ -166,6 +171,11 @@ class StyleManager:
     def is_initialised(cls) -> bool:
         return cls._initialised
 
+    @classmethod
+    def version(cls) -> int:
+        """Returns a counter that changes whenever the colours are re-initialised."""
+        return cls._version
+
     @classmethod
     @debug_log
     def mode(cls) -> str:
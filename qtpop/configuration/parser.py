@@ -34,6 +34,8 @@ class ConfigurationManager:
         self.json_path = json_path
         self.settings = QSettings(org, app)
         self.data: AppSettings | None = None
+        self._value_cache: dict = {}  # setting_key -> SettingItem / static value
+        self.revision = 0  # bumped when settings are added/removed or a static value is replaced
 
         self.load()
 
@@ -46,6 +48,7 @@ class ConfigurationManager:
         if self.json_path == "":
             raise ConfigurationJsonNotProvided()
         qt_logger.info(f"Loading configuration from {self.json_path}")
+        self._value_cache.clear()
         with open(self.json_path, "r", encoding="utf-8") as f:
             raw = json.load(f)
 
@@ -59,6 +62,7 @@ class ConfigurationManager:
                 plugins={k: PageInfo(**v) for k, v in raw["page_mapping"]["plugins"].items()}
             )
         )
+        self.revision += 1
         qt_logger.info(f"Loaded configuration from {self.json_path}")
         self._save_to_q_settings(raw)
 
@@ -76,6 +80,9 @@ class ConfigurationManager:
         if not self.data:
             raise ConfigurationNotLoadedError()
 
+        if not as_string and setting_key in self._value_cache:
+            return self._value_cache[setting_key]
+
         setting_obj = self.data.configuration.user.get(setting_key)
         is_user_setting = setting_obj is not None
 
@@ -86,7 +93,10 @@ class ConfigurationManager:
             raise SettingNotFoundError(setting_key)
 
         # value = getattr(setting_obj, 'value', setting_obj)
-        return self._serialize(setting_obj) if as_string else setting_obj
+        if as_string:
+            return self._serialize(setting_obj)
+        self._value_cache[setting_key] = setting_obj
+        return setting_obj
 
     @debug_log
     def set_value(self, setting_key: str, value):
@@ -94,12 +104,16 @@ class ConfigurationManager:
         if not self.data:
             raise ConfigurationNotLoadedError()
 
+        self._value_cache.pop(setting_key, None)
         setting_obj = self.data.configuration.user.get(setting_key)
         if not setting_obj:
             setting_obj = self.data.configuration.static.get(setting_key)
             if setting_obj is None:
                 raise SettingNotFoundError(setting_key)
             else:
+                if setting_obj != value:
+                    # Saving re-writes every row; only real edits invalidate caches
+                    self.revision += 1
                 self.data.configuration.static[setting_key] = value
                 q_settings_key = f"configuration/static/{setting_key}/value"
         else:
@@ -115,6 +129,8 @@ class ConfigurationManager:
         if not self.data:
             raise ConfigurationNotLoadedError()
         self.data.configuration.user[key] = setting_item
+        self._value_cache.pop(key, None)
+        self.revision += 1
         self.save()
 
     @debug_log
@@ -124,6 +140,8 @@ class ConfigurationManager:
             raise ConfigurationNotLoadedError()
         if key in self.data.configuration.user:
             del self.data.configuration.user[key]
+            self._value_cache.pop(key, None)
+            self.revision += 1
             # Remove from QSettings as well
             self.settings.remove(f"configuration/user/{key}")
             self.settings.sync()
@@ -34,6 +34,8 @@ class QtPopDataLayer(QObject):
         if not hasattr(self, "_initialized"):
             super().__init__()
             self._data: Dict[str, Any] = {}
+            self._last_style: str | None = None
+            self._last_config: Dict[str, Any] | None = None
             self._initialized = True
 
     # ---- Public API ----
@@ -55,15 +57,33 @@ class QtPopDataLayer(QObject):
         self.messageBroadcast.emit(channel, payload)
 
     @debug_log
-    def update_style(self, style_key: str):
-        """Emit style update event."""
+    def update_style(self, style_key: str, only_if_changed: bool = False):
+        """Emit style update event; with only_if_changed, skip a repeat of the last style."""
+        if only_if_changed and style_key == self._last_style:
+            return
+        self._last_style = style_key
         self.styleUpdated.emit(style_key)
 
     @debug_log
-    def update_config(self, new_config: Dict[str, Any]):
-        """Emit config update signal."""
+    def update_config(self, new_config: Dict[str, Any], only_if_changed: bool = False):
+        """Emit config update signal; with only_if_changed, skip a repeat of the last snapshot."""
+        if only_if_changed and new_config == self._last_config:
+            return
+        self._last_config = dict(new_config)
         self.configUpdated.emit(new_config)
 
+    @debug_log
+    def update_appearance(self, style_key: str, new_config: Dict[str, Any],
+                          only_if_changed: bool = False):
+        """
+        Publish a style and config change in one call.
+
+        Equivalent to update_style() followed by update_config(); with
+        only_if_changed, each signal fires only if its part changed.
+        """
+        self.update_style(style_key, only_if_changed)
+        self.update_config(new_config, only_if_changed)
+
     # ---- Utility ----
     @classmethod
     @debug_log
@@ -170,7 +170,7 @@ def debug_log(func):
             else:
                 return f"<{type(v).__name__}>"
 
-        formatted_args = ", ".join(f"{k}={format_value(v)}" for k, v in bound.arguments.items())
+        formatted_args = ", ".join([f"{k}={format_value(v)}" for k, v in bound.arguments.items()])
 
         qt_logger.debug(f"{cls_name}{func.__name__}({formatted_args}) called")
 